@@ -1,31 +1,44 @@
 import argparse
+import atexit
 import logging
-import json
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import sys
+import time
 from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-from vcbot.app import authorize_reddit, generate_sample_post, retry_failed_posts, run, sync_mods
-from vcbot.bethesda import BethesdaClient
 from vcbot.config import Config, load_config
-from vcbot.db import SQLiteStore
+
+if TYPE_CHECKING:
+    from vcbot.bethesda import BethesdaClient
+    from vcbot.db import SQLiteStore
+
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
 
 
 def _configure_logging(verbose: bool, trace: bool, log_file: Optional[str]) -> None:
     level = logging.DEBUG if (trace or verbose) else logging.INFO
-    handlers = []
     if not log_file:
-        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        stamp = time.strftime("%Y%m%d-%H%M%S")
         log_file = f"logs/vcbot-{stamp}.log"
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    handlers.append(logging.FileHandler(log_path, encoding="utf-8"))
+    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    # Callers only enqueue records; the listener thread does the file I/O.
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter())
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     logging.basicConfig(
         level=level,
-        format="%(asctime)s %(levelname)s %(message)s",
-        handlers=handlers,
+        format=_LOG_FORMAT,
+        handlers=[queue_handler],
     )
     if trace:
         logging.getLogger("vcbot.trace").setLevel(logging.DEBUG)
@@ -34,26 +47,46 @@ def _configure_logging(verbose: bool, trace: bool, log_file: Optional[str]) -> N
 
 
 def _apply_overrides(config: Config, args: argparse.Namespace) -> Config:
-    updated = config
-    if args.product:
-        updated = replace(updated, product=args.product.strip().upper())
-    if args.sort:
-        updated = replace(updated, sort=args.sort)
-    if args.time_period:
-        updated = replace(updated, time_period=args.time_period)
-    if args.size is not None:
-        updated = replace(updated, size=args.size)
-    if args.page is not None:
-        updated = replace(updated, page=args.page)
-    if args.counts_platform:
-        updated = replace(updated, counts_platform=args.counts_platform)
-    if args.post_template:
-        updated = replace(updated, post_template_path=Path(args.post_template))
-    if args.db:
-        updated = replace(updated, database_path=Path(args.db))
-    if args.mod_url_template:
-        updated = replace(updated, mod_url_template=args.mod_url_template)
-    return updated
+    # Subcommands without the common args (export-db, retry, ...) lack these attributes.
+    overrides: Dict[str, object] = {}
+    product = getattr(args, "product", None)
+    if product:
+        overrides["product"] = product.strip().upper()
+    if getattr(args, "sort", None):
+        overrides["sort"] = args.sort
+    if getattr(args, "time_period", None):
+        overrides["time_period"] = args.time_period
+    if getattr(args, "size", None) is not None:
+        overrides["size"] = args.size
+    if getattr(args, "page", None) is not None:
+        overrides["page"] = args.page
+    if getattr(args, "counts_platform", None):
+        overrides["counts_platform"] = args.counts_platform
+    if getattr(args, "post_template", None):
+        overrides["post_template_path"] = Path(args.post_template)
+    if getattr(args, "db", None):
+        overrides["database_path"] = Path(args.db)
+    if getattr(args, "mod_url_template", None):
+        overrides["mod_url_template"] = args.mod_url_template
+    return replace(config, **overrides) if overrides else config
+
+
+def _write_export(store: "SQLiteStore", output_path: str) -> None:
+    """Stream every exported table to disk one row at a time."""
+    from vcbot.db import EXPORT_TABLES
+    from vcbot.utils import json_dumps
+
+    with open(output_path, "wb", buffering=1 << 20) as handle:
+        handle.write(b"{")
+        for table_index, table in enumerate(EXPORT_TABLES):
+            if table_index:
+                handle.write(b",")
+            handle.write(b"\n" + json_dumps(table) + b": [")
+            for row_index, row in enumerate(store.iter_export_rows(table)):
+                handle.write(b",\n" if row_index else b"\n")
+                handle.write(json_dumps(row))
+            handle.write(b"\n]")
+        handle.write(b"\n}\n")
 
 
 def _add_common_args(parser: argparse.ArgumentParser) -> None:
@@ -71,7 +104,9 @@ def _add_common_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--mod-url-template", help="Template for mod detail URLs")
 
 
-def _create_client(config: Config) -> BethesdaClient:
+def _create_client(config: Config) -> "BethesdaClient":
+    from vcbot.bethesda import BethesdaClient
+
     return BethesdaClient(
         core_url=config.bethesda_core_url,
         content_url=config.bethesda_content_url,
@@ -84,21 +119,12 @@ def _create_client(config: Config) -> BethesdaClient:
     )
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Bethesda mod tracker and Reddit poster")
-    parser.add_argument("--env", help="Path to .env file")
-    parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
-    parser.add_argument("--trace", action="store_true", help="Enable trace logging")
-    parser.add_argument(
-        "--log-file",
-        help="Log file path (defaults to logs/vcbot-<timestamp>.log)",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
+def _add_fetch_parser(subparsers: argparse._SubParsersAction) -> None:
     fetch_parser = subparsers.add_parser("fetch", help="Fetch mods and update local DB")
     _add_common_args(fetch_parser)
 
+
+def _add_run_parser(subparsers: argparse._SubParsersAction) -> None:
     run_parser = subparsers.add_parser("run", help="Fetch mods and post to Reddit")
     _add_common_args(run_parser)
     run_parser.add_argument("--no-new", action="store_true", help="Disable new mod posts")
@@ -110,12 +136,18 @@ def main() -> None:
         help="Write Reddit/Discord templates to this directory instead of posting",
     )
 
+
+def _add_export_parser(subparsers: argparse._SubParsersAction) -> None:
     export_parser = subparsers.add_parser("export-db", help="Export DB to JSON")
     export_parser.add_argument("--output", default="db_export.json", help="Output JSON path")
 
+
+def _add_import_parser(subparsers: argparse._SubParsersAction) -> None:
     import_parser = subparsers.add_parser("import-db", help="Import DB from JSON")
     import_parser.add_argument("--input", required=True, help="Input JSON path")
 
+
+def _add_retry_parser(subparsers: argparse._SubParsersAction) -> None:
     retry_parser = subparsers.add_parser(
         "retry", help="Retry failed or missed posts"
     )
@@ -123,10 +155,14 @@ def main() -> None:
         "--dry-run", action="store_true", help="Preview retries without sending"
     )
 
-    auth_parser = subparsers.add_parser(
+
+def _add_auth_parser(subparsers: argparse._SubParsersAction) -> None:
+    subparsers.add_parser(
         "reddit-auth", help="Authorize Reddit and store refresh token"
     )
 
+
+def _add_sample_parser(subparsers: argparse._SubParsersAction) -> None:
     sample_parser = subparsers.add_parser(
         "sample", help="Generate a sample markdown post locally"
     )
@@ -148,6 +184,55 @@ def main() -> None:
         help="Max pages to scan for eligible creations",
     )
 
+
+_SUBCOMMANDS: Dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "fetch": _add_fetch_parser,
+    "run": _add_run_parser,
+    "export-db": _add_export_parser,
+    "import-db": _add_import_parser,
+    "retry": _add_retry_parser,
+    "reddit-auth": _add_auth_parser,
+    "sample": _add_sample_parser,
+}
+
+# Top-level options that consume the following argv token as their value.
+_VALUE_OPTIONS = {"--env", "--log-file"}
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the requested subcommand, or None when help or a full parser is needed."""
+    if "-h" in argv or "--help" in argv:
+        return None
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg in _VALUE_OPTIONS:
+            skip_next = True
+        elif not arg.startswith("-"):
+            return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bethesda mod tracker and Reddit poster")
+    parser.add_argument("--env", help="Path to .env file")
+    parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
+    parser.add_argument("--trace", action="store_true", help="Enable trace logging")
+    parser.add_argument(
+        "--log-file",
+        help="Log file path (defaults to logs/vcbot-<timestamp>.log)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    # Only build the requested subcommand; help and error paths get all of them.
+    selected = _sniff_subcommand(sys.argv[1:])
+    if selected:
+        _SUBCOMMANDS[selected](subparsers)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(subparsers)
+
     args = parser.parse_args()
     _configure_logging(args.verbose, args.trace, args.log_file)
 
@@ -156,18 +241,20 @@ def main() -> None:
     config = _apply_overrides(config, args)
 
     if args.command == "fetch":
-        store = SQLiteStore(config.database_path)
+        from vcbot.app import sync_mods
+        from vcbot.db import get_shared_store
+
+        store = get_shared_store(config.database_path)
         client = _create_client(config)
-        try:
-            _, fetched = sync_mods(
-                config, store, client, post_new=False, post_updates=False, dry_run=False
-            )
-            logging.info("Fetched %s mods and updated DB", fetched)
-        finally:
-            store.close()
+        _, fetched = sync_mods(
+            config, store, client, post_new=False, post_updates=False, dry_run=False
+        )
+        logging.info("Fetched %s mods and updated DB", fetched)
         return
 
     if args.command == "run":
+        from vcbot.app import run
+
         dry_run = args.dry_run or config.dry_run
         post_new = not args.no_new
         post_updates = not args.no_updates
@@ -182,6 +269,8 @@ def main() -> None:
         return
 
     if args.command == "sample":
+        from vcbot.app import generate_sample_post
+
         generate_sample_post(
             config,
             output_path=args.output,
@@ -194,34 +283,32 @@ def main() -> None:
         return
 
     if args.command == "export-db":
-        store = SQLiteStore(config.database_path)
-        try:
-            payload = store.export_json()
-            Path(args.output).write_text(
-                json.dumps(payload, indent=2, ensure_ascii=True),
-                encoding="utf-8",
-            )
-            logging.info("Exported DB to %s", args.output)
-        finally:
-            store.close()
+        from vcbot.db import get_shared_store
+
+        store = get_shared_store(config.database_path)
+        _write_export(store, args.output)
+        logging.info("Exported DB to %s", args.output)
         return
 
     if args.command == "import-db":
-        store = SQLiteStore(config.database_path)
-        try:
-            raw = Path(args.input).read_text(encoding="utf-8")
-            payload = json.loads(raw)
-            store.import_json(payload)
-            logging.info("Imported DB from %s", args.input)
-        finally:
-            store.close()
+        from vcbot.db import get_shared_store
+        from vcbot.utils import json_loads
+
+        store = get_shared_store(config.database_path)
+        payload = json_loads(Path(args.input).read_bytes())
+        store.import_json(payload)
+        logging.info("Imported DB from %s", args.input)
         return
 
     if args.command == "retry":
+        from vcbot.app import retry_failed_posts
+
         retry_failed_posts(config, dry_run=args.dry_run)
         return
 
     if args.command == "reddit-auth":
+        from vcbot.app import authorize_reddit
+
         authorize_reddit(config)
         return
 
@@ -0,0 +1,99 @@
+import dataclasses
+import tempfile
+import unittest
+from pathlib import Path
+
+from vcbot.app import sync_mods
+from vcbot.bethesda import Mod
+from vcbot.config import Config
+from vcbot.db import SQLiteStore
+
+
+def _config(**overrides) -> Config:
+    values = {field.name: None for field in dataclasses.fields(Config)}
+    values.update(
+        product="FALLOUT4",
+        sort="first_ptime",
+        size=20,
+        page=1,
+        dry_run=False,
+    )
+    values.update(overrides)
+    return Config(**values)
+
+
+def _mod(mod_id: str, first_ptime: str) -> Mod:
+    values = {}
+    for field in dataclasses.fields(Mod):
+        if field.type is bool:
+            values[field.name] = False
+        elif str(field.type).startswith("typing.List"):
+            values[field.name] = []
+        elif str(field.type).startswith("typing.Dict"):
+            values[field.name] = {}
+        else:
+            values[field.name] = None
+    values.update(
+        mod_id=mod_id,
+        title=f"Mod {mod_id}",
+        product="FALLOUT4",
+        author_displayname="Creator",
+        author_verified=True,
+        first_published_at=first_ptime,
+        prices=[{"amount": 500}],
+    )
+    return Mod(**values)
+
+
+class _PagedClient:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def fetch_mods(self, page, **_):
+        return self.pages[page - 1] if page <= len(self.pages) else []
+
+
+class SyncModsCrashTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteStore(Path(self.tmp.name) / "vcbot.db")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_mods_after_a_failed_handler_stay_eligible(self):
+        page = [
+            _mod("a", "2024-03-03T00:00:00+00:00"),
+            _mod("b", "2024-03-02T00:00:00+00:00"),
+            _mod("c", "2024-03-01T00:00:00+00:00"),
+        ]
+        client = _PagedClient([page])
+        config = _config()
+        handled = []
+
+        def crash_on_b(action, mod):
+            if mod.mod_id == "b":
+                raise KeyboardInterrupt
+            handled.append((action, mod.mod_id))
+
+        with self.assertRaises(KeyboardInterrupt):
+            sync_mods(config, self.store, client, True, False, False, action_handler=crash_on_b)
+        self.assertEqual(handled, [("new", "a")])
+        self.assertIsNone(self.store.get_mod("c"))
+
+        handled.clear()
+        sync_mods(
+            config,
+            self.store,
+            client,
+            True,
+            False,
+            False,
+            action_handler=lambda action, mod: handled.append((action, mod.mod_id)),
+        )
+        self.assertEqual(handled, [("new", "c")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,28 +1,68 @@
 import logging
+import re
 import shutil
 import uuid
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from urllib.parse import parse_qs, urlparse
-import threading
+from urllib.parse import parse_qs, quote, urlencode, urlparse
 import concurrent.futures
 import requests
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-from .bethesda import BethesdaClient, Mod, compute_mod_hash
+from .bethesda import BethesdaClient, Mod, compute_mod_hash, mod_hash_scheme
 from .config import Config
 from .db import NullStore, SQLiteStore
-from .formatter import _image_urls, build_post_title, render_post_body
+from .formatter import _image_urls, build_post_title, render_post_body, render_post_template
 from .reddit_client import RedditClient
 from .discord_client import DiscordClient
-from .utils import parse_iso, utc_now_iso, download_image
+from .http_session import get_session
+from .utils import parse_iso, utc_now_iso, download_image, download_image_bytes, json_loads
 
 logger = logging.getLogger(__name__)
 
+_BGS_AUTHOR = "bethesdagamestudios"
+
+# Shared by every caller that downloads a post's images. Kept separate from the
+# template-writing pool so a template task waiting on its images can't starve it.
+_IMAGE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="vcbot-images"
+)
+
+
+@dataclass(frozen=True)
+class _ParsedConfig:
+    """Config cutoffs parsed once per run instead of once per mod."""
+
+    hard_stops: Dict[str, Optional[datetime]]
+    bgs_ignore_before: Optional[datetime]
+    effective_cutoff: Optional[datetime] = None
+
+
+def _parse_config(config: Config, effective_cutoff: Optional[str] = None) -> _ParsedConfig:
+    return _ParsedConfig(
+        hard_stops={
+            product: parse_iso(value)
+            for product, value in _hard_stops_by_product(config).items()
+        },
+        bgs_ignore_before=parse_iso(config.bgs_ignore_before),
+        effective_cutoff=parse_iso(effective_cutoff),
+    )
+
+
+def _mod_first_ptime(mod: Mod) -> Optional[datetime]:
+    return parse_iso(mod.first_published_at) or parse_iso(mod.published_at)
+
 
 def _is_update_due(existing: dict, mod: Mod, mod_hash: str) -> bool:
     existing_hash = existing.get("last_known_hash")
-    changed = not existing_hash or existing_hash != mod_hash
+    # Hashes from different schemes (digest, serializer or field set) can't be compared; the
+    # upsert re-stamps the row with the current scheme.
+    changed = not existing_hash or (
+        existing_hash != mod_hash
+        and mod_hash_scheme(existing_hash) == mod_hash_scheme(mod_hash)
+    )
 
     updated_at = parse_iso(mod.published_at) or parse_iso(mod.updated_at)
     last_update_posted_at = parse_iso(
@@ -36,42 +76,46 @@ def _is_update_due(existing: dict, mod: Mod, mod_hash: str) -> bool:
     return changed
 
 
-def _determine_action(
-    existing: Optional[dict],
+def _classify_mod(
     mod: Mod,
+    mod_time: Optional[datetime],
+    existing: Optional[dict],
     mod_hash: str,
     post_new: bool,
     post_updates: bool,
-    config: Config,
-) -> Optional[str]:
+    parsed: _ParsedConfig,
+) -> Tuple[Optional[str], bool]:
+    """Return ``(action, eligible)`` for a fetched mod in a single pass."""
+    eligible = _is_new_creation(mod, mod_time, parsed)
     if existing is None:
-        return "new" if post_new and _is_new_creation(mod, config) else None
-
+        return ("new" if post_new and eligible else None), eligible
     if post_updates and _is_update_due(existing, mod, mod_hash):
-        return "update"
-
-    return None
+        return "update", eligible
+    return None, eligible
 
 
-def _is_new_creation(mod: Mod, config: Config) -> bool:
+def _is_new_creation(
+    mod: Mod, mod_time: Optional[datetime], parsed: _ParsedConfig
+) -> bool:
     author = mod.author_displayname or "Unknown"
-    if not _passes_hard_stop(mod, config):
+    is_bgs = (mod.author_displayname or "").lower() == _BGS_AUTHOR
+    if not _passes_hard_stop(mod, mod_time, parsed):
         logger.debug("Skip %s (%s): before hard stop", mod.mod_id, author)
         return False
-    if not _passes_bgs_ignore(mod, config):
+    if not _passes_bgs_ignore(mod_time, parsed, is_bgs):
         logger.debug("Skip %s (%s): BGS ignore cutoff", mod.mod_id, author)
         return False
     if not mod.author_verified:
         logger.debug("Skip %s (%s): author not verified", mod.mod_id, author)
         return False
     if not mod.prices:
-        if (mod.author_displayname or "").lower() != "bethesdagamestudios":
+        if not is_bgs:
             logger.debug("Skip %s (%s): missing prices", mod.mod_id, author)
             return False
         logger.debug("Allow %s (%s): BGS zero price", mod.mod_id, author)
         return True
     if not _has_paid_price(mod.prices):
-        if (mod.author_displayname or "").lower() != "bethesdagamestudios":
+        if not is_bgs:
             logger.debug("Skip %s (%s): no paid price", mod.mod_id, author)
             return False
         logger.debug("Allow %s (%s): BGS zero price", mod.mod_id, author)
@@ -79,54 +123,58 @@ def _is_new_creation(mod: Mod, config: Config) -> bool:
     return True
 
 
+def _price_amount(amount: object) -> float:
+    # The API normally sends JSON numbers; only strings need float().
+    if isinstance(amount, (int, float)):
+        return amount
+    try:
+        return float(amount)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 def _has_paid_price(prices: List[dict]) -> bool:
-    for price in prices:
-        amount = price.get("amount")
-        try:
-            if amount is not None and float(amount) > 0:
-                return True
-        except (TypeError, ValueError):
-            continue
-    return False
-
-
-def _passes_hard_stop(mod: Mod, config: Config) -> bool:
-    if mod.product == "FALLOUT4":
-        cutoff = parse_iso(config.fallout4_hard_stop)
-    elif mod.product == "SKYRIM":
-        cutoff = parse_iso(config.skyrim_hard_stop)
-    elif mod.product == "STARFIELD":
-        cutoff = parse_iso(config.starfield_hard_stop)
-    else:
-        return True
-    mod_date = parse_iso(mod.first_published_at) or parse_iso(mod.published_at)
-    if not cutoff or not mod_date:
+    return any(_price_amount(price.get("amount")) > 0 for price in prices)
+
+
+def _passes_hard_stop(
+    mod: Mod, mod_time: Optional[datetime], parsed: _ParsedConfig
+) -> bool:
+    cutoff = parsed.hard_stops.get(mod.product)
+    if not cutoff or not mod_time:
         return True
-    return mod_date >= cutoff
+    return mod_time >= cutoff
 
 
-def _passes_bgs_ignore(mod: Mod, config: Config) -> bool:
-    if (mod.author_displayname or "").lower() != "bethesdagamestudios":
+def _passes_bgs_ignore(
+    mod_time: Optional[datetime], parsed: _ParsedConfig, is_bgs: bool
+) -> bool:
+    if not is_bgs:
         return True
-    cutoff = parse_iso(config.bgs_ignore_before)
-    mod_date = parse_iso(mod.first_published_at) or parse_iso(mod.published_at)
-    if not cutoff or not mod_date:
+    cutoff = parsed.bgs_ignore_before
+    if not cutoff or not mod_time:
         return True
-    return mod_date >= cutoff
+    return mod_time >= cutoff
+
+
+class _TemplateStrings(dict):
+    """Template text keyed by path, read on first use and reused for the run."""
+
+    def __missing__(self, path: Path) -> str:
+        text = self[path] = path.read_text(encoding="utf-8")
+        return text
 
 
 def _attempt_id() -> str:
     return uuid.uuid4().hex
 
 
+# \w matches exactly the isalnum() characters plus "_" (Unicode-aware).
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w-]")
+
+
 def _safe_filename(value: str) -> str:
-    cleaned = []
-    for ch in value:
-        if ch.isalnum() or ch in {"-", "_"}:
-            cleaned.append(ch)
-        else:
-            cleaned.append("_")
-    return "".join(cleaned).strip("_")
+    return _UNSAFE_FILENAME_CHARS.sub("_", value).strip("_")
 
 
 def _meta_key_first_ptime(product: str) -> str:
@@ -143,22 +191,21 @@ def _resolve_first_ptime_cutoff(
     return store.get_meta(_meta_key_first_ptime(config.product))
 
 
-def _is_before_or_equal_first_ptime(mod: Mod, cutoff: str) -> bool:
-    mod_time = parse_iso(mod.first_published_at) or parse_iso(mod.published_at)
-    cutoff_time = parse_iso(cutoff)
+def _is_before_or_equal_first_ptime(
+    mod_time: Optional[datetime], parsed: _ParsedConfig
+) -> bool:
+    cutoff_time = parsed.effective_cutoff
     if not mod_time or not cutoff_time:
         return False
     return mod_time <= cutoff_time
 
 
-def _hard_stop_for_product(config: Config) -> Optional[str]:
-    if config.product == "FALLOUT4":
-        return config.fallout4_hard_stop
-    if config.product == "SKYRIM":
-        return config.skyrim_hard_stop
-    if config.product == "STARFIELD":
-        return config.starfield_hard_stop
-    return None
+def _hard_stops_by_product(config: Config) -> Dict[str, Optional[str]]:
+    return {
+        "FALLOUT4": config.fallout4_hard_stop,
+        "SKYRIM": config.skyrim_hard_stop,
+        "STARFIELD": config.starfield_hard_stop,
+    }
 
 
 def _write_wiki_output(
@@ -167,20 +214,21 @@ def _write_wiki_output(
     wiki_dir: Path,
     base_name: str,
     reddit_dir: Optional[Path] = None,
+    gallery_urls: Optional[List[str]] = None,
 ) -> None:
     """Write wiki output file and images to a subfolder."""
     post_wiki_dir = wiki_dir / base_name
-    post_wiki_dir.mkdir(parents=True, exist_ok=True)
+    # Callers create wiki_dir up front, so only the per-post folder is needed.
+    post_wiki_dir.mkdir(exist_ok=True)
     
     # Use mod title for wiki filename
-    safe_title = _safe_filename(mod.title)
-    (post_wiki_dir / f"{safe_title}.wiki").write_text(
-        wiki_body + "\n", encoding="utf-8"
-    )
-    logger.info("Wrote %s", (post_wiki_dir / f"{safe_title}.wiki").resolve())
+    wiki_path = post_wiki_dir / f"{_safe_filename(mod.title)}.wiki"
+    wiki_path.write_text(wiki_body + "\n", encoding="utf-8")
+    logger.info("Wrote %s", wiki_path.resolve())
     
     # Download/copy images for wiki
-    gallery_urls = _image_urls(mod)
+    if gallery_urls is None:
+        gallery_urls = _image_urls(mod)
     reddit_base_dir = reddit_dir / base_name if reddit_dir else None
     
     if mod.preview_image_url:
@@ -200,17 +248,75 @@ def _write_wiki_output(
             download_image(url, wiki_img_path, convert_to_jpg=True)
 
 
-def _flair_id_for_product(mod: Mod, config: Config) -> Optional[str]:
-    if mod.product == "FALLOUT4":
-        return config.reddit_fallout4_flair_id
-    elif mod.product == "SKYRIM":
-        return config.reddit_skyrim_flair_id
-    elif mod.product == "STARFIELD":
-        return config.reddit_starfield_flair_id
-    return None
+def _image_sources(
+    mod: Mod, preview_name: str, gallery_urls: Optional[List[str]] = None
+) -> List[Tuple[str, str]]:
+    """(url, file name) pairs: the preview image first, then the gallery."""
+    if gallery_urls is None:
+        gallery_urls = _image_urls(mod)
+    sources: List[Tuple[str, str]] = []
+    if mod.preview_image_url:
+        sources.append((mod.preview_image_url, preview_name))
+    for i, url in enumerate(gallery_urls):
+        sources.append((url, f"image_{i+1:02d}.jpg"))
+    return sources
+
+
+def _image_targets(
+    mod: Mod,
+    dest_dir: Path,
+    preview_name: str,
+    gallery_urls: Optional[List[str]] = None,
+) -> List[Tuple[str, Path]]:
+    return [
+        (url, dest_dir / name)
+        for url, name in _image_sources(mod, preview_name, gallery_urls)
+    ]
+
+
+def _download_images(
+    targets: List[Tuple[str, Path]], executor: concurrent.futures.Executor
+) -> List[Path]:
+    """Download all targets concurrently; returns the saved paths in input order."""
+    results = executor.map(
+        lambda target: download_image(target[0], target[1], convert_to_jpg=True),
+        targets,
+    )
+    return [path for (_, path), ok in zip(targets, results) if ok]
+
+
+def _download_image_blobs(
+    mod: Mod, executor: concurrent.futures.Executor
+) -> List[Tuple[str, bytes]]:
+    """Like _download_images, but keeps the JPEG bytes in memory for upload."""
+    sources = _image_sources(mod, "preview.jpg")
+    results = executor.map(
+        lambda source: download_image_bytes(source[0], convert_to_jpg=True), sources
+    )
+    return [(name, blob) for (_, name), blob in zip(sources, results) if blob is not None]
+
+
+def _flair_ids_by_product(config: Config) -> Dict[str, Optional[str]]:
+    return {
+        "FALLOUT4": config.reddit_fallout4_flair_id,
+        "SKYRIM": config.reddit_skyrim_flair_id,
+        "STARFIELD": config.reddit_starfield_flair_id,
+    }
+
+
+# The UTC form utils.iso_from_epoch writes; strings in this form sort chronologically.
+_CANONICAL_UTC_ISO = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\+00:00")
 
 
 def _max_iso(left: Optional[str], right: Optional[str]) -> Optional[str]:
+    if (
+        left
+        and right
+        and _CANONICAL_UTC_ISO.fullmatch(left)
+        and _CANONICAL_UTC_ISO.fullmatch(right)
+    ):
+        return max(left, right)
+    # Env overrides may use other offsets or precisions, so compare as datetimes.
     left_time = parse_iso(left) if left else None
     right_time = parse_iso(right) if right else None
     if left_time and right_time:
@@ -240,6 +346,8 @@ def generate_sample_post(
         config.product,
         max_pages,
     )
+    parsed = _parse_config(config)
+    templates = _TemplateStrings()
     found_any = False
     reddit_entries: List[str] = []
     discord_entries: List[str] = []
@@ -264,12 +372,12 @@ def generate_sample_post(
                 mod.author_verified,
                 len(mod.prices),
             )
-            if _is_new_creation(mod, config):
+            if _is_new_creation(mod, _mod_first_ptime(mod), parsed):
                 title = build_post_title(mod, "new", include_emojis=False)
-                body = render_post_body(mod, "new", config.post_template_path)
+                body = render_post_template(mod, "new", templates[config.post_template_path])
                 reddit_entries.append(f"# {title}\n\n{body}")
                 discord_entries.append(
-                    render_post_body(mod, "new", config.discord_template_path)
+                    render_post_template(mod, "new", templates[config.discord_template_path])
                 )
                 found_any = True
 
@@ -284,6 +392,47 @@ def generate_sample_post(
     )
 
 
+def _iter_pages(
+    client: BethesdaClient,
+    config: Config,
+    start_page: int,
+    wants_next: Callable[[List[Mod]], bool],
+) -> Iterator[Tuple[int, List[Mod]]]:
+    """Yield ``(page, mods)``, fetching the next page while the caller works on this one.
+
+    The next page is only requested when ``wants_next(mods)`` says the caller will
+    ask for it, so stopping never leaves a wasted (or blocking) request behind.
+    """
+
+    def fetch(page: int) -> List[Mod]:
+        return client.fetch_mods(
+            product=config.product,
+            sort=config.sort,
+            time_period=config.time_period,
+            size=config.size,
+            page=page,
+            counts_platform=config.counts_platform,
+            mod_url_template=config.mod_url_template,
+        )
+
+    prefetcher = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        page = start_page
+        pending = prefetcher.submit(fetch, page)
+        while True:
+            mods = pending.result()
+            if not mods or not wants_next(mods):
+                yield page, mods
+                return
+            pending = prefetcher.submit(fetch, page + 1)
+            yield page, mods
+            page += 1
+    finally:
+        # Only reached with a request in flight if the caller bailed out early
+        # (e.g. an exception); don't make it sit through that request's retries.
+        prefetcher.shutdown(wait=False, cancel_futures=True)
+
+
 def sync_mods(
     config: Config,
     store: SQLiteStore,
@@ -295,35 +444,46 @@ def sync_mods(
     emit_eligible: bool = False,
 ) -> Tuple[List[Tuple[str, Mod]], int]:
     cutoff = _resolve_first_ptime_cutoff(config, store, dry_run)
-    hard_stop = _hard_stop_for_product(config)
+    hard_stop = _hard_stops_by_product(config).get(config.product)
     effective_cutoff = _max_iso(cutoff, hard_stop)
     logger.info("Effective first_ptime cutoff: %s", effective_cutoff or "None")
-    page = max(config.page, 1)
+    parsed = _parse_config(config, effective_cutoff)
     total_seen = 0
+    # Datetimes drive the comparisons; the matching strings are kept for logging/meta.
     max_first_ptime: Optional[str] = None
+    max_first_dt: Optional[datetime] = None
     actions: List[Tuple[str, Mod]] = []
     now = utc_now_iso()
 
-    while True:
-        mods = client.fetch_mods(
-            product=config.product,
-            sort=config.sort,
-            time_period=config.time_period,
-            size=config.size,
-            page=page,
-            counts_platform=config.counts_platform,
-            mod_url_template=config.mod_url_template,
+    def wants_next(mods: List[Mod]) -> bool:
+        # Mirrors the stop check below, so a page that ends the sync isn't prefetched past.
+        return not any(
+            mod.mod_id
+            and _is_before_or_equal_first_ptime(
+                parse_iso(mod.first_published_at) or parse_iso(mod.published_at), parsed
+            )
+            for mod in mods
         )
+
+    for page, mods in _iter_pages(client, config, max(config.page, 1), wants_next):
         logger.info("Fetched %s mods (page %s)", len(mods), page)
         total_seen += len(mods)
         stop = False
         page_last_first_ptime: Optional[str] = None
+        page_last_first_dt: Optional[datetime] = None
+        # Rows without an action are written in one transaction per page. A mod
+        # with an action is stored only right before its handler runs, so a crash
+        # mid-page leaves the unposted mods looking new/changed on the next run.
+        page_rows: List[Tuple[Mod, str, str]] = []
+        page_actions: List[Tuple[str, Mod, str]] = []
 
         for mod in mods:
             if not mod.mod_id:
                 logger.warning("Skipping mod with missing content_id")
                 continue
-            if effective_cutoff and _is_before_or_equal_first_ptime(mod, effective_cutoff):
+            first_dt = parse_iso(mod.first_published_at)
+            mod_time = first_dt or parse_iso(mod.published_at)
+            if _is_before_or_equal_first_ptime(mod_time, parsed):
                 logger.info(
                     "Stopping at mod %s first_ptime=%s cutoff=%s",
                     mod.mod_id,
@@ -334,36 +494,37 @@ def sync_mods(
 
             mod_hash = compute_mod_hash(mod)
             existing = store.get_mod(mod.mod_id)
-            action = _determine_action(
-                existing, mod, mod_hash, post_new, post_updates, config
+            action, eligible = _classify_mod(
+                mod, mod_time, existing, mod_hash, post_new, post_updates, parsed
             )
-            eligible = _is_new_creation(mod, config)
             logger.debug(
                 "Decision %s: action=%s eligible=%s",
                 mod.mod_id,
                 action,
                 eligible,
             )
-            store.upsert_mod(mod, last_seen_at=now, mod_hash=mod_hash)
             if action:
-                if action_handler:
-                    action_handler(action, mod)
-                else:
-                    actions.append((action, mod))
+                page_actions.append((action, mod, mod_hash))
             elif emit_eligible and eligible:
-                if action_handler:
-                    action_handler("new", mod)
-                else:
-                    actions.append(("new", mod))
-            if mod.first_published_at and (
-                max_first_ptime is None or mod.first_published_at > max_first_ptime
-            ):
-                max_first_ptime = mod.first_published_at
-            if mod.first_published_at and (
-                page_last_first_ptime is None
-                or mod.first_published_at < page_last_first_ptime
-            ):
-                page_last_first_ptime = mod.first_published_at
+                page_actions.append(("new", mod, mod_hash))
+            else:
+                page_rows.append((mod, now, mod_hash))
+            if first_dt:
+                if max_first_dt is None or first_dt > max_first_dt:
+                    max_first_dt = first_dt
+                    max_first_ptime = mod.first_published_at
+                if page_last_first_dt is None or first_dt < page_last_first_dt:
+                    page_last_first_dt = first_dt
+                    page_last_first_ptime = mod.first_published_at
+
+        store.upsert_mods(page_rows)
+        for action, mod, mod_hash in page_actions:
+            # Upserted first so mark_posted (inside the handler) finds the mods row.
+            store.upsert_mod(mod, now, mod_hash)
+            if action_handler:
+                action_handler(action, mod)
+            else:
+                actions.append((action, mod))
 
         if page_last_first_ptime:
             logger.info(
@@ -372,7 +533,6 @@ def sync_mods(
 
         if stop or not mods:
             break
-        page += 1
 
     if max_first_ptime and not dry_run:
         store.set_meta(_meta_key_first_ptime(config.product), max_first_ptime)
@@ -399,6 +559,8 @@ def run(
         timeout_seconds=config.request_timeout_seconds,
     )
 
+    flair_ids = _flair_ids_by_product(config)
+    templates = _TemplateStrings()
     try:
         if ignore_db and not manual_output_dir:
             dry_run = True
@@ -435,7 +597,7 @@ def run(
             title = build_post_title(mod, action, include_emojis=False)
 
             if dry_run:
-                body = render_post_body(mod, action, config.post_template_path)
+                body = render_post_template(mod, action, templates[config.post_template_path])
                 logger.info("DRY RUN %s: %s", action.upper(), title)
                 logger.debug(body)
                 dry_run_count += 1
@@ -450,11 +612,15 @@ def run(
                 discord_dir.mkdir(parents=True, exist_ok=True)
                 wiki_dir.mkdir(parents=True, exist_ok=True)
                 logger.info("Manual output directory: %s", output_dir.resolve())
-                reddit_body = render_post_body(mod, action, config.post_template_path)
-                discord_body = render_post_body(
-                    mod, action, config.discord_template_path
+                reddit_body = render_post_template(
+                    mod, action, templates[config.post_template_path]
+                )
+                discord_body = render_post_template(
+                    mod, action, templates[config.discord_template_path]
+                )
+                wiki_body = render_post_template(
+                    mod, action, templates[config.wiki_template_path]
                 )
-                wiki_body = render_post_body(mod, action, config.wiki_template_path)
                 base_name = _safe_filename(
                     f"{(mod.first_published_at or 'unknown')[:10]}_{mod.author_displayname or 'Unknown'}_{mod.title}"
                 )
@@ -468,12 +634,14 @@ def run(
                 logger.info(
                     "Wrote %s", (post_reddit_dir / f"{base_name}.md").resolve()
                 )
-                if mod.preview_image_url:
-                    download_image(mod.preview_image_url, post_reddit_dir / "image_00_preview.jpg", convert_to_jpg=True)
-                
+                # Shared by the reddit and wiki image steps below.
                 gallery_urls = _image_urls(mod)
-                for i, url in enumerate(gallery_urls):
-                    download_image(url, post_reddit_dir / f"image_{i+1:02d}.jpg", convert_to_jpg=True)
+                _download_images(
+                    _image_targets(
+                        mod, post_reddit_dir, "image_00_preview.jpg", gallery_urls
+                    ),
+                    _IMAGE_EXECUTOR,
+                )
 
                 (discord_dir / f"{base_name}.md").write_text(
                     discord_body + "\n", encoding="utf-8"
@@ -481,34 +649,20 @@ def run(
                 logger.info(
                     "Wrote %s", (discord_dir / f"{base_name}.md").resolve()
                 )
-                _write_wiki_output(mod, wiki_body, wiki_dir, base_name, reddit_dir)
+                _write_wiki_output(
+                    mod, wiki_body, wiki_dir, base_name, reddit_dir, gallery_urls
+                )
                 post_count += 1
                 return
 
             post_count += 1
             try:
-                image_paths = []
-                # Use a temporary directory or data folder for transient images
-                # For simplicity in 'run' mode, let's reuse the logic but clean up or use a specific folder
-                temp_img_dir = Path("data/temp_images") / mod.mod_id
-                temp_img_dir.mkdir(parents=True, exist_ok=True)
-                
-                if mod.preview_image_url:
-                    img_path = temp_img_dir / "preview.jpg"
-                    if download_image(mod.preview_image_url, img_path, convert_to_jpg=True):
-                        image_paths.append(img_path)
-                
-                gallery_urls = _image_urls(mod)
-                for i, url in enumerate(gallery_urls):
-                    img_path = temp_img_dir / f"image_{i+1:02d}.jpg"
-                    if download_image(url, img_path, convert_to_jpg=True):
-                        image_paths.append(img_path)
-
+                image_blobs = _download_image_blobs(mod, _IMAGE_EXECUTOR)
                 post_id, post_url = reddit.submit_post(
                     title, 
-                    render_post_body(mod, action, config.post_template_path),
-                    flair_id=_flair_id_for_product(mod, config),
-                    image_paths=image_paths
+                    render_post_template(mod, action, templates[config.post_template_path]),
+                    flair_id=flair_ids.get(mod.product),
+                    image_blobs=image_blobs,
                 )
                 store.mark_posted(
                     mod_id=mod.mod_id,
@@ -536,7 +690,9 @@ def run(
                 logger.exception("Reddit post failed for %s", mod.mod_id)
 
             if discord:
-                discord_body = render_post_body(mod, action, config.discord_template_path)
+                discord_body = render_post_template(
+                    mod, action, templates[config.discord_template_path]
+                )
                 try:
                     discord.send_message(discord_body)
                     store.mark_posted(
@@ -610,6 +766,8 @@ def retry_failed_posts(config: Config, dry_run: bool = False) -> None:
         except Exception as exc:
             logger.warning("Discord client init failed: %s", exc)
 
+    flair_ids = _flair_ids_by_product(config)
+    templates = _TemplateStrings()
     try:
         if reddit:
             failed = store.get_failed_posts("reddit")
@@ -620,29 +778,19 @@ def retry_failed_posts(config: Config, dry_run: bool = False) -> None:
                     logger.warning("Missing mod for retry: %s", entry["mod_id"])
                     continue
                 title = build_post_title(mod, entry["post_type"])
-                body = render_post_body(mod, entry["post_type"], config.post_template_path)
+                body = render_post_template(
+                    mod, entry["post_type"], templates[config.post_template_path]
+                )
                 if dry_run:
                     logger.info("DRY RUN retry reddit: %s", title)
                     continue
                 try:
-                    image_paths = []
-                    temp_img_dir = Path("data/temp_images") / mod.mod_id
-                    temp_img_dir.mkdir(parents=True, exist_ok=True)
-                    if mod.preview_image_url:
-                        img_path = temp_img_dir / "preview.jpg"
-                        if download_image(mod.preview_image_url, img_path, convert_to_jpg=True):
-                            image_paths.append(img_path)
-                    gallery_urls = _image_urls(mod)
-                    for i, url in enumerate(gallery_urls):
-                        img_path = temp_img_dir / f"image_{i+1:02d}.jpg"
-                        if download_image(url, img_path, convert_to_jpg=True):
-                            image_paths.append(img_path)
-
+                    image_blobs = _download_image_blobs(mod, _IMAGE_EXECUTOR)
                     post_id, post_url = reddit.submit_post(
                         title, 
                         body, 
-                        flair_id=_flair_id_for_product(mod, config),
-                        image_paths=image_paths
+                        flair_id=flair_ids.get(mod.product),
+                        image_blobs=image_blobs,
                     )
                     store.mark_posted(
                         mod_id=mod.mod_id,
@@ -679,8 +827,8 @@ def retry_failed_posts(config: Config, dry_run: bool = False) -> None:
                 if not mod:
                     logger.warning("Missing mod for retry: %s", entry["mod_id"])
                     continue
-                body = render_post_body(
-                    mod, entry["post_type"], config.discord_template_path
+                body = render_post_template(
+                    mod, entry["post_type"], templates[config.discord_template_path]
                 )
                 if dry_run:
                     logger.info("DRY RUN retry discord: %s", mod.mod_id)
@@ -720,7 +868,7 @@ def generate_template_files(
     output_dir: str,
     template_kind: str,
     cutoff_date: str,
-) -> Tuple[int, List[Tuple[str, str, List[str], str, Optional[str]]]]:
+) -> Tuple[int, List[Tuple[str, str, Tuple[Path, ...], str, Optional[str]]]]:
     client = BethesdaClient(
         core_url=config.bethesda_core_url,
         content_url=config.bethesda_content_url,
@@ -741,6 +889,8 @@ def generate_template_files(
     if not template_path:
         raise ValueError("template_kind must be reddit, discord, or wiki")
 
+    parsed = _parse_config(config)
+    flair_ids = _flair_ids_by_product(config)
     out_base = Path(output_dir)
     out_dir = out_base / template_kind.lower()
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -766,11 +916,11 @@ def generate_template_files(
             stop = False
             futures = []
             for mod in mods:
-                mod_time = parse_iso(mod.first_published_at) or parse_iso(mod.published_at)
+                mod_time = _mod_first_ptime(mod)
                 if mod_time and mod_time <= cutoff:
                     stop = True
                     continue
-                if not _is_new_creation(mod, config):
+                if not _is_new_creation(mod, mod_time, parsed):
                     continue
 
                 futures.append(executor.submit(
@@ -779,7 +929,7 @@ def generate_template_files(
                     template_kind=template_kind,
                     template_path=template_path,
                     out_dir=out_dir,
-                    config=config
+                    flair_id=flair_ids.get(mod.product),
                 ))
 
             for future in concurrent.futures.as_completed(futures):
@@ -804,8 +954,8 @@ def _write_template_task(
     template_kind: str,
     template_path: Path,
     out_dir: Path,
-    config: Config
-) -> Optional[Tuple[str, str, List[str], str, Optional[str]]]:
+    flair_id: Optional[str],
+) -> Optional[Tuple[str, str, Tuple[Path, ...], str, Optional[str]]]:
     try:
         title = build_post_title(mod, "new", include_emojis=False)
         body = render_post_body(mod, "new", template_path)
@@ -813,26 +963,21 @@ def _write_template_task(
         base_name = _safe_filename(
             f"{pub_date[:10]}_{mod.author_displayname or 'Unknown'}_{mod.title}"
         )
-        suffix = "md" if template_kind.lower() in {"reddit", "discord"} else "wiki"
+        kind = template_kind.lower()
+        suffix = "md" if kind in {"reddit", "discord"} else "wiki"
         
-        image_paths = []
-        gallery_urls = _image_urls(mod)
-        if template_kind.lower() == "reddit":
+        image_paths: List[Path] = []
+        if kind == "reddit":
+            # out_dir is created by generate_template_files before any task runs.
             post_dir = out_dir / base_name
-            post_dir.mkdir(parents=True, exist_ok=True)
+            post_dir.mkdir(exist_ok=True)
             (post_dir / f"{base_name}.{suffix}").write_text(
                 f"# {title}\n\n{body}\n", encoding="utf-8"
             )
-            if mod.preview_image_url:
-                img_path = post_dir / "image_00_preview.jpg"
-                if download_image(mod.preview_image_url, img_path, convert_to_jpg=True):
-                    image_paths.append(str(img_path))
-            
-            for i, url in enumerate(gallery_urls):
-                img_path = post_dir / f"image_{i+1:02d}.jpg"
-                if download_image(url, img_path, convert_to_jpg=True):
-                    image_paths.append(str(img_path))
-        elif template_kind.lower() == "wiki":
+            image_paths = _download_images(
+                _image_targets(mod, post_dir, "image_00_preview.jpg"), _IMAGE_EXECUTOR
+            )
+        elif kind == "wiki":
             reddit_dir = out_dir.parent / "reddit"
             _write_wiki_output(mod, body, out_dir, base_name, reddit_dir)
         else:
@@ -840,7 +985,7 @@ def _write_template_task(
                 f"# {title}\n\n{body}\n", encoding="utf-8"
             )
             
-        return title, body, image_paths, pub_date, _flair_id_for_product(mod, config)
+        return title, body, tuple(image_paths), pub_date, flair_id
     except Exception as exc:
         logger.error("Failed to write template for %s: %s", mod.mod_id, exc)
         return None
@@ -851,24 +996,29 @@ def authorize_reddit(config: Config) -> None:
         raise ValueError("Missing Reddit client configuration")
     if not config.reddit_redirect_uri:
         raise ValueError("Missing REDDIT_REDIRECT_URI")
+    redirect = urlparse(config.reddit_redirect_uri)
+    redirect_path = redirect.path
     scope = config.reddit_oauth_scope or "identity submit"
     state = _attempt_id()
-    auth_url = (
-        "https://www.reddit.com/api/v1/authorize"
-        f"?client_id={config.reddit_client_id}"
-        f"&response_type=code"
-        f"&state={state}"
-        f"&redirect_uri={config.reddit_redirect_uri}"
-        f"&duration=permanent"
-        f"&scope={scope.replace(' ', '%20')}"
+    query = urlencode(
+        {
+            "client_id": config.reddit_client_id,
+            "response_type": "code",
+            "state": state,
+            "redirect_uri": config.reddit_redirect_uri,
+            "duration": "permanent",
+            "scope": scope,
+        },
+        quote_via=quote,
     )
+    auth_url = f"https://www.reddit.com/api/v1/authorize?{query}"
 
     code_holder = {"code": None, "state": None}
 
     class Handler(BaseHTTPRequestHandler):
         def do_GET(self) -> None:
             parsed = urlparse(self.path)
-            if parsed.path != urlparse(config.reddit_redirect_uri).path:
+            if parsed.path != redirect_path:
                 self.send_response(404)
                 self.end_headers()
                 return
@@ -883,15 +1033,16 @@ def authorize_reddit(config: Config) -> None:
         def log_message(self, format: str, *args: object) -> None:
             return
 
-    redirect = urlparse(config.reddit_redirect_uri)
     server = HTTPServer((redirect.hostname or "localhost", redirect.port or 8080), Handler)
 
-    thread = threading.Thread(target=server.handle_request, daemon=True)
-    thread.start()
+    # HTTPServer already sets SO_REUSEADDR, so quick re-runs can rebind the port.
+    server.timeout = 300
 
     logger.info("Open this URL to authorize Reddit:\n%s", auth_url)
-    thread.join(timeout=300)
-    server.server_close()
+    try:
+        server.handle_request()
+    finally:
+        server.server_close()
 
     if code_holder["state"] != state or not code_holder["code"]:
         raise RuntimeError("OAuth callback failed or was not received.")
@@ -905,7 +1056,7 @@ def authorize_reddit(config: Config) -> None:
         "redirect_uri": config.reddit_redirect_uri,
     }
     headers = {"User-Agent": config.reddit_user_agent or "vcbot"}
-    response = requests.post(
+    response = get_session().post(
         "https://www.reddit.com/api/v1/access_token",
         auth=auth,
         data=data,
@@ -913,14 +1064,19 @@ def authorize_reddit(config: Config) -> None:
         timeout=30,
     )
     response.raise_for_status()
-    payload = response.json()
+    payload = json_loads(response.content)
     refresh_token = payload.get("refresh_token")
     if not refresh_token:
         raise RuntimeError("No refresh_token in Reddit response")
 
     store = SQLiteStore(config.database_path)
     try:
-        store.set_meta("reddit_refresh_token", refresh_token)
+        store.set_meta_many(
+            {
+                "reddit_refresh_token": refresh_token,
+                "reddit_token_obtained_at": utc_now_iso(),
+            }
+        )
         logger.info("Stored Reddit refresh token in DB meta")
     finally:
         store.close()
@@ -1,18 +1,30 @@
 from dataclasses import dataclass
+import functools
 import hashlib
 import html
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
 import logging
-import requests
 
-from .utils import bethesda_image_url, iso_from_epoch
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # optional speedup, sha256 is the fallback
+    xxhash = None
+
+from .http_session import get_session
+from .utils import bethesda_image_url, iso_from_epoch, json_loads
 
 logger = logging.getLogger("vcbot.trace")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Mod:
     mod_id: str
     title: str
@@ -82,9 +94,15 @@ def _extract_image_url(image_obj: Optional[Dict]) -> Optional[str]:
     return None
 
 
-def _extract_prices(item: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _unescape(value: Optional[str]) -> Optional[str]:
+    """html.unescape, skipped for the common case of text with no entities."""
+    if not value:
+        return None
+    return html.unescape(value) if "&" in value else value
+
+
+def _extract_prices(catalog_info: Any) -> List[Dict[str, Any]]:
     prices: List[Dict[str, Any]] = []
-    catalog_info = item.get("catalog_info") or []
     if isinstance(catalog_info, list):
         for catalog in catalog_info:
             if not isinstance(catalog, dict):
@@ -95,21 +113,34 @@ def _extract_prices(item: Dict[str, Any]) -> List[Dict[str, Any]]:
     return prices
 
 
+@functools.lru_cache(maxsize=8)
+def _mod_url_formatter(mod_url_template: str) -> Optional[Callable[..., str]]:
+    """Validate a mod URL template once; None means every mod gets no details URL."""
+    try:
+        mod_url_template.format(content_id="content_id", product="product")
+    except (KeyError, IndexError, ValueError) as exc:
+        logger.warning("Invalid mod URL template %r: %s", mod_url_template, exc)
+        return None
+    return mod_url_template.format
+
+
 def parse_mod(item: Dict, mod_url_template: Optional[str] = None) -> Mod:
     mod_id = item.get("content_id") or ""
     product = item.get("product") or ""
     details_url = None
     if mod_id and product:
         if mod_url_template:
-            try:
-                details_url = mod_url_template.format(content_id=mod_id, product=product)
-            except (KeyError, IndexError, ValueError):
-                details_url = None
+            format_url = _mod_url_formatter(mod_url_template)
+            if format_url is not None:
+                details_url = format_url(content_id=mod_id, product=product)
         else:
             details_url = f"https://creations.bethesda.net/en/{product.lower()}/details/{mod_id}"
 
     description_raw = item.get("description")
     overview_raw = item.get("overview")
+    preview_image = item.get("preview_image")
+    cover_image = item.get("cover_image")
+    catalog_info = item.get("catalog_info") or []
 
     # Fallback logic: if description is missing, use overview. 
     # If overview is missing, use description (though overview is usually shorter).
@@ -120,15 +151,15 @@ def parse_mod(item: Dict, mod_url_template: Optional[str] = None) -> Mod:
 
     return Mod(
         mod_id=mod_id,
-        title=html.unescape(item.get("title") or ""),
-        overview=html.unescape(overview_raw) if overview_raw else None,
-        description=html.unescape(description_raw) if description_raw else None,
+        title=_unescape(item.get("title")) or "",
+        overview=_unescape(overview_raw),
+        description=_unescape(description_raw),
         product=product,
-        product_title=html.unescape(item.get("product_title")) if item.get("product_title") else None,
+        product_title=_unescape(item.get("product_title")),
         content_type=item.get("content_type"),
         hardware_platforms=item.get("hardware_platforms") or [],
         categories=item.get("categories") or [],
-        author_displayname=html.unescape(item.get("author_displayname")) if item.get("author_displayname") else None,
+        author_displayname=_unescape(item.get("author_displayname")),
         author_buid=item.get("author_buid"),
         author_verified=bool(item.get("author_verified")),
         author_official=bool(item.get("author_official")),
@@ -159,19 +190,26 @@ def parse_mod(item: Dict, mod_url_template: Optional[str] = None) -> Mod:
         release_notes=item.get("release_notes") or [],
         stats=item.get("stats") or {},
         custom_data=item.get("custom_data"),
-        catalog_info=item.get("catalog_info") or [],
-        prices=_extract_prices(item),
-        preview_image_url=_extract_image_url(item.get("preview_image")),
-        cover_image_url=_extract_image_url(item.get("cover_image")),
-        preview_image=item.get("preview_image") or {},
-        cover_image=item.get("cover_image") or {},
+        catalog_info=catalog_info,
+        prices=_extract_prices(catalog_info),
+        preview_image_url=_extract_image_url(preview_image),
+        cover_image_url=_extract_image_url(cover_image),
+        preview_image=preview_image or {},
+        cover_image=cover_image or {},
         screenshot_images=item.get("screenshot_images") or [],
         videos=item.get("videos") or [],
         details_url=details_url,
     )
 
 
+# Bumped whenever the hashed field set changes. v2 dropped stats (download and
+# rating counters, which move on every poll) and catalog_info (its prices are
+# hashed via the prices field).
+_HASH_PAYLOAD_VERSION = "/v2"
+
+
 def compute_mod_hash(mod: Mod) -> str:
+    """Hash the fields whose changes can warrant an update post."""
     payload = {
         "title": mod.title,
         "overview": mod.overview,
@@ -210,13 +248,41 @@ def compute_mod_hash(mod: Mod) -> str:
         "default_locale": mod.default_locale,
         "supported_locales": mod.supported_locales,
         "release_notes": mod.release_notes,
-        "stats": mod.stats,
         "custom_data": mod.custom_data,
-        "catalog_info": mod.catalog_info,
         "prices": mod.prices,
     }
-    raw = json.dumps(payload, sort_keys=True, ensure_ascii=True)
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    # orjson formats some floats differently from stdlib json, so the serializer
+    # is part of the scheme tag just like the digest algorithm and payload version.
+    if orjson is not None:
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        serializer = "+orjson"
+    else:
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+        serializer = ""
+    if xxhash is not None:
+        return f"xxh3{serializer}{_HASH_PAYLOAD_VERSION}:{xxhash.xxh3_128_hexdigest(raw)}"
+    return f"sha256{serializer}{_HASH_PAYLOAD_VERSION}:{hashlib.sha256(raw).hexdigest()}"
+
+
+def mod_hash_scheme(mod_hash: str) -> str:
+    """Name the digest/serializer/payload behind a stored hash; unprefixed values are legacy sha256."""
+    scheme, sep, _ = mod_hash.partition(":")
+    return scheme if sep else "sha256"
+
+
+@functools.lru_cache(maxsize=32)
+def _content_query(
+    product: str, sort: str, time_period: str, size: int, counts_platform: str
+) -> str:
+    return urlencode(
+        {
+            "product": product,
+            "sort": sort,
+            "time_period": time_period,
+            "size": size,
+            "counts_platform": counts_platform,
+        }
+    )
 
 
 class BethesdaClient:
@@ -239,14 +305,15 @@ class BethesdaClient:
         self.origin = origin
         self.referer = referer
         self.user_agent = user_agent
-        self.session = requests.Session()
+        self.session = get_session()
+        self._headers_cache: Dict[Tuple[str, Optional[str]], Dict[str, str]] = {}
 
     def get_bnet_key(self) -> str:
         if self._bnet_key:
             return self._bnet_key
         response = self.session.get(self.core_url, timeout=self.timeout_seconds)
         response.raise_for_status()
-        payload = response.json()
+        payload = json_loads(response.content)
         key = payload.get("ugc", {}).get("bnetKey")
         if not key:
             raise RuntimeError("Unable to resolve ugc.bnetKey from core payload")
@@ -254,6 +321,11 @@ class BethesdaClient:
         return key
 
     def _headers(self, product: str) -> Dict[str, str]:
+        # Keyed on the bearer too, so rotating self.bearer builds fresh headers.
+        cache_key = (product, self.bearer)
+        cached = self._headers_cache.get(cache_key)
+        if cached is not None:
+            return cached
         headers = {
             "accept": "application/json",
             "x-bnet-product": product,
@@ -267,6 +339,7 @@ class BethesdaClient:
             headers["referer"] = self.referer
         if self.user_agent:
             headers["user-agent"] = self.user_agent
+        self._headers_cache[cache_key] = headers
         return headers
 
     def fetch_content(
@@ -278,23 +351,18 @@ class BethesdaClient:
         page: int,
         counts_platform: str,
     ) -> Dict:
-        params = {
-            "product": product,
-            "sort": sort,
-            "time_period": time_period,
-            "size": size,
-            "page": page,
-            "counts_platform": counts_platform,
-        }
+        # Only the page number changes while paginating a crawl.
+        base_query = _content_query(product, sort, time_period, size, counts_platform)
         response = self.session.get(
             self.content_url,
-            params=params,
+            params=f"{base_query}&page={page}",
             headers=self._headers(product),
             timeout=self.timeout_seconds,
         )
-        logger.debug("RAW_RESPONSE: %s", response.text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RAW_RESPONSE: %s", response.text)
         response.raise_for_status()
-        payload = response.json()
+        payload = json_loads(response.content)
         return payload.get("platform", {}).get("response", {})
 
     def fetch_mods(
@@ -320,9 +388,9 @@ class BethesdaClient:
         mods: List[Mod] = []
         for item in items:
             if isinstance(item, dict) and isinstance(item.get("data"), dict):
-                mods.append(parse_mod(item["data"], mod_url_template))
+                mod = parse_mod(item["data"], mod_url_template)
             else:
-                mods.append(parse_mod(item, mod_url_template))
-        for mod in mods:
+                mod = parse_mod(item, mod_url_template)
             logger.debug("MOD: %s %s", mod.mod_id, mod.title)
+            mods.append(mod)
         return mods
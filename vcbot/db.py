@@ -1,9 +1,19 @@
-import json
+import atexit
+import itertools
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .bethesda import Mod
+from .utils import json_dumps, json_loads
+
+EXPORT_TABLES = ("mods", "posts", "meta")
+
+# Stored in PRAGMA user_version; bump whenever _init_schema changes.
+_SCHEMA_VERSION = 1
+
+# (mod_id, post_id, post_type, target, success, error_message, posted_at, title, url)
+PostRow = Tuple[str, str, str, str, int, Optional[str], str, Optional[str], Optional[str]]
 
 
 class SQLiteStore:
@@ -13,12 +23,24 @@ class SQLiteStore:
         self.conn = sqlite3.connect(str(self.path))
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA foreign_keys = ON")
+        self._configure_pragmas()
         self._init_schema()
 
     def close(self) -> None:
         self.conn.close()
 
+    def _configure_pragmas(self) -> None:
+        # WAL + NORMAL sync keeps writes durable at checkpoint without an fsync per commit.
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -65536")
+        self.conn.execute("PRAGMA mmap_size = 268435456")
+
     def _init_schema(self) -> None:
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        if version >= _SCHEMA_VERSION:
+            return
         self.conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS mods (
@@ -143,6 +165,14 @@ class SQLiteStore:
                 "error_message": "TEXT",
             },
         )
+        # Created after _ensure_columns: older databases gain target/success there.
+        self.conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_posts_target_success
+                ON posts(target, success, mod_id, post_type)
+            """
+        )
+        self.conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
         self.conn.commit()
 
     def _ensure_columns(self, table: str, columns: Dict[str, str]) -> None:
@@ -220,14 +250,13 @@ class SQLiteStore:
     def get_failed_posts(self, target: str) -> List[Dict[str, Any]]:
         cursor = self.conn.execute(
             """
-            SELECT mod_id, post_type
+            SELECT DISTINCT mod_id, post_type
             FROM posts
             WHERE target = ? AND success = 0
-            GROUP BY mod_id, post_type
             """,
             (target,),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return [{"mod_id": mod_id, "post_type": post_type} for mod_id, post_type in cursor]
 
     def get_missing_discord_posts(self) -> List[Dict[str, Any]]:
         cursor = self.conn.execute(
@@ -244,7 +273,7 @@ class SQLiteStore:
               )
             """
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return [{"mod_id": mod_id, "post_type": post_type} for mod_id, post_type in cursor]
 
     def get_meta(self, key: str) -> Optional[str]:
         cursor = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,))
@@ -254,20 +283,27 @@ class SQLiteStore:
         return row["value"]
 
     def set_meta(self, key: str, value: str) -> None:
+        self.set_meta_many({key: value})
+
+    def set_meta_many(self, pairs: Dict[str, str]) -> None:
+        """Write several meta keys in one transaction."""
         with self.conn:
-            self.conn.execute(
+            self.conn.executemany(
                 """
                 INSERT INTO meta (key, value) VALUES (?, ?)
                 ON CONFLICT(key) DO UPDATE SET value = excluded.value
                 """,
-                (key, value),
+                pairs.items(),
             )
 
+    def iter_export_rows(self, table: str) -> Iterator[Dict[str, Any]]:
+        if table not in EXPORT_TABLES:
+            raise ValueError(f"table must be one of {', '.join(EXPORT_TABLES)}")
+        for row in self.conn.execute(f"SELECT * FROM {table}"):
+            yield dict(row)
+
     def export_json(self) -> Dict[str, Any]:
-        mods = [dict(row) for row in self.conn.execute("SELECT * FROM mods")]
-        posts = [dict(row) for row in self.conn.execute("SELECT * FROM posts")]
-        meta = [dict(row) for row in self.conn.execute("SELECT * FROM meta")]
-        return {"mods": mods, "posts": posts, "meta": meta}
+        return {table: list(self.iter_export_rows(table)) for table in EXPORT_TABLES}
 
     def import_json(self, payload: Dict[str, Any]) -> None:
         mods = payload.get("mods") or []
@@ -280,215 +316,34 @@ class SQLiteStore:
                         "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
                         (row["key"], row["value"]),
                     )
-            for row in mods:
-                columns = list(row.keys())
-                if not columns:
-                    continue
-                placeholders = ", ".join("?" for _ in columns)
-                cols = ", ".join(columns)
-                values = [row[col] for col in columns]
-                self.conn.execute(
-                    f"INSERT OR REPLACE INTO mods ({cols}) VALUES ({placeholders})",
-                    values,
-                )
-            for row in posts:
-                columns = list(row.keys())
-                if not columns:
-                    continue
-                placeholders = ", ".join("?" for _ in columns)
-                cols = ", ".join(columns)
-                values = [row[col] for col in columns]
-                self.conn.execute(
-                    f"INSERT OR REPLACE INTO posts ({cols}) VALUES ({placeholders})",
-                    values,
-                )
+            self._import_rows("mods", mods)
+            self._import_rows("posts", posts)
+
+    def _import_rows(self, table: str, rows: Iterable[Dict[str, Any]]) -> None:
+        # Exports from older schemas may omit columns; keeping each row's own column
+        # list lets those fall back to their defaults. Runs of rows with the same
+        # columns (normally the whole table) share one prepared statement.
+        for columns, group in itertools.groupby(rows, key=lambda row: tuple(row.keys())):
+            if not columns:
+                continue
+            placeholders = ", ".join("?" for _ in columns)
+            cols = ", ".join(columns)
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({cols}) VALUES ({placeholders})",
+                ([row[col] for col in columns] for row in group),
+            )
 
     def upsert_mod(self, mod: Mod, last_seen_at: str, mod_hash: str) -> None:
-        categories_json = json.dumps(mod.categories, ensure_ascii=True)
-        platforms_json = json.dumps(mod.hardware_platforms, ensure_ascii=True)
-        author_price_json = json.dumps(mod.author_price, ensure_ascii=True)
-        required_dlc_json = json.dumps(mod.required_dlc, ensure_ascii=True)
-        required_mods_json = json.dumps(mod.required_mods, ensure_ascii=True)
-        supported_locales_json = json.dumps(mod.supported_locales, ensure_ascii=True)
-        release_notes_json = json.dumps(mod.release_notes, ensure_ascii=True)
-        stats_json = json.dumps(mod.stats, ensure_ascii=True)
-        custom_data_json = json.dumps(mod.custom_data, ensure_ascii=True)
-        catalog_info_json = json.dumps(mod.catalog_info, ensure_ascii=True)
-        prices_json = json.dumps(mod.prices, ensure_ascii=True)
-        preview_image_json = json.dumps(mod.preview_image, ensure_ascii=True)
-        cover_image_json = json.dumps(mod.cover_image, ensure_ascii=True)
-        screenshot_images_json = json.dumps(mod.screenshot_images, ensure_ascii=True)
-        videos_json = json.dumps(mod.videos, ensure_ascii=True)
+        self.upsert_mods([(mod, last_seen_at, mod_hash)])
+
+    def upsert_mods(self, rows: Iterable[Tuple[Mod, str, str]]) -> None:
+        """Upsert ``(mod, last_seen_at, mod_hash)`` rows in a single transaction."""
         with self.conn:
-            self.conn.execute(
-                """
-                INSERT INTO mods (
-                    mod_id,
-                    product,
-                    product_title,
-                    title,
-                    overview,
-                    description,
-                    content_type,
-                    author_displayname,
-                    author_buid,
-                    author_verified,
-                    author_official,
-                    published_buid,
-                    updated_buid,
-                    created_at,
-                    published_at,
-                    first_published_at,
-                    updated_at,
-                    status,
-                    moderation_state,
-                    error_info,
-                    deleted,
-                    published,
-                    moderated,
-                    beta,
-                    maintenance,
-                    restricted,
-                    use_high_report_threshold,
-                    marketplace,
-                    review_revision,
-                    author_price_json,
-                    required_dlc_json,
-                    required_mods_json,
-                    achievement_friendly,
-                    default_locale,
-                    supported_locales_json,
-                    release_notes_json,
-                    stats_json,
-                    custom_data_json,
-                    catalog_info_json,
-                    prices_json,
-                    categories_json,
-                    platforms_json,
-                    preview_image_url,
-                    cover_image_url,
-                    preview_image_json,
-                    cover_image_json,
-                    screenshot_images_json,
-                    videos_json,
-                    details_url,
-                    first_seen_at,
-                    last_seen_at,
-                    last_seen_ptime,
-                    last_known_hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(mod_id) DO UPDATE SET
-                    product = excluded.product,
-                    product_title = excluded.product_title,
-                    title = excluded.title,
-                    overview = excluded.overview,
-                    description = excluded.description,
-                    content_type = excluded.content_type,
-                    author_displayname = excluded.author_displayname,
-                    author_buid = excluded.author_buid,
-                    author_verified = excluded.author_verified,
-                    author_official = excluded.author_official,
-                    published_buid = excluded.published_buid,
-                    updated_buid = excluded.updated_buid,
-                    created_at = excluded.created_at,
-                    published_at = excluded.published_at,
-                    first_published_at = excluded.first_published_at,
-                    updated_at = excluded.updated_at,
-                    status = excluded.status,
-                    moderation_state = excluded.moderation_state,
-                    error_info = excluded.error_info,
-                    deleted = excluded.deleted,
-                    published = excluded.published,
-                    moderated = excluded.moderated,
-                    beta = excluded.beta,
-                    maintenance = excluded.maintenance,
-                    restricted = excluded.restricted,
-                    use_high_report_threshold = excluded.use_high_report_threshold,
-                    marketplace = excluded.marketplace,
-                    review_revision = excluded.review_revision,
-                    author_price_json = excluded.author_price_json,
-                    required_dlc_json = excluded.required_dlc_json,
-                    required_mods_json = excluded.required_mods_json,
-                    achievement_friendly = excluded.achievement_friendly,
-                    default_locale = excluded.default_locale,
-                    supported_locales_json = excluded.supported_locales_json,
-                    release_notes_json = excluded.release_notes_json,
-                    stats_json = excluded.stats_json,
-                    custom_data_json = excluded.custom_data_json,
-                    catalog_info_json = excluded.catalog_info_json,
-                    prices_json = excluded.prices_json,
-                    categories_json = excluded.categories_json,
-                    platforms_json = excluded.platforms_json,
-                    preview_image_url = excluded.preview_image_url,
-                    cover_image_url = excluded.cover_image_url,
-                    preview_image_json = excluded.preview_image_json,
-                    cover_image_json = excluded.cover_image_json,
-                    screenshot_images_json = excluded.screenshot_images_json,
-                    videos_json = excluded.videos_json,
-                    details_url = excluded.details_url,
-                    last_seen_at = excluded.last_seen_at,
-                    last_seen_ptime = excluded.last_seen_ptime,
-                    last_known_hash = excluded.last_known_hash,
-                    first_seen_at = COALESCE(mods.first_seen_at, excluded.first_seen_at)
-                """,
-                (
-                    mod.mod_id,
-                    mod.product,
-                    mod.product_title,
-                    mod.title,
-                    mod.overview,
-                    mod.description,
-                    mod.content_type,
-                    mod.author_displayname,
-                    mod.author_buid,
-                    int(mod.author_verified),
-                    int(mod.author_official),
-                    mod.published_buid,
-                    mod.updated_buid,
-                    mod.created_at,
-                    mod.published_at,
-                    mod.first_published_at,
-                    mod.updated_at,
-                    mod.status,
-                    mod.moderation_state,
-                    mod.error_info,
-                    int(mod.deleted),
-                    int(mod.published),
-                    int(mod.moderated),
-                    int(mod.beta),
-                    int(mod.maintenance),
-                    int(mod.restricted),
-                    int(mod.use_high_report_threshold),
-                    int(mod.marketplace),
-                    int(mod.review_revision),
-                    author_price_json,
-                    required_dlc_json,
-                    required_mods_json,
-                    int(mod.achievement_friendly),
-                    mod.default_locale,
-                    supported_locales_json,
-                    release_notes_json,
-                    stats_json,
-                    custom_data_json,
-                    catalog_info_json,
-                    prices_json,
-                    categories_json,
-                    platforms_json,
-                    mod.preview_image_url,
-                    mod.cover_image_url,
-                    preview_image_json,
-                    cover_image_json,
-                    screenshot_images_json,
-                    videos_json,
-                    mod.details_url,
-                    last_seen_at,
-                    last_seen_at,
-                    mod.published_at,
-                    mod_hash,
-                ),
+            self.conn.executemany(
+                _UPSERT_MOD_SQL,
+                (_mod_params(mod, seen_at, mod_hash) for mod, seen_at, mod_hash in rows),
             )
 
-
     def mark_posted(
         self,
         mod_id: str,
@@ -503,39 +358,258 @@ class SQLiteStore:
     ) -> None:
         if post_type not in {"new", "update"}:
             raise ValueError("post_type must be 'new' or 'update'")
+        row = (
+            mod_id,
+            post_id,
+            post_type,
+            target,
+            int(success),
+            error_message,
+            posted_at,
+            title,
+            url,
+        )
+        # Committed right away: the Reddit/Discord post already happened, and a lost
+        # row means a duplicate post (or an unretried failure) on the next run.
+        self.mark_posted_bulk([row])
+
+    def mark_posted_bulk(self, rows: Iterable[PostRow]) -> None:
+        """Record ``PostRow`` tuples and stamp their mods in one transaction."""
+        rows = list(rows)
         with self.conn:
-            self.conn.execute(
-                """
-                INSERT INTO posts (mod_id, post_id, post_type, target, success, error_message, posted_at, title, url)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    mod_id,
-                    post_id,
-                    post_type,
-                    target,
-                    int(success),
-                    error_message,
-                    posted_at,
-                    title,
-                    url,
-                ),
+            self.conn.executemany(_INSERT_POST_SQL, rows)
+            self.conn.executemany(
+                _UPDATE_LAST_POSTED_SQL,
+                [(row[6], row[0]) for row in rows if row[2] == "new"],
+            )
+            self.conn.executemany(
+                _UPDATE_LAST_UPDATE_POSTED_SQL,
+                [(row[6], row[0]) for row in rows if row[2] != "new"],
             )
-            if post_type == "new":
-                self.conn.execute(
-                    "UPDATE mods SET last_posted_at = ? WHERE mod_id = ?",
-                    (posted_at, mod_id),
-                )
-            else:
-                self.conn.execute(
-                    "UPDATE mods SET last_update_posted_at = ? WHERE mod_id = ?",
-                    (posted_at, mod_id),
-                )
+
+
+_INSERT_POST_SQL = """
+    INSERT INTO posts (mod_id, post_id, post_type, target, success, error_message, posted_at, title, url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_LAST_POSTED_SQL = "UPDATE mods SET last_posted_at = ? WHERE mod_id = ?"
+
+_UPDATE_LAST_UPDATE_POSTED_SQL = "UPDATE mods SET last_update_posted_at = ? WHERE mod_id = ?"
+
+_UPSERT_MOD_SQL = """
+    INSERT INTO mods (
+        mod_id,
+        product,
+        product_title,
+        title,
+        overview,
+        description,
+        content_type,
+        author_displayname,
+        author_buid,
+        author_verified,
+        author_official,
+        published_buid,
+        updated_buid,
+        created_at,
+        published_at,
+        first_published_at,
+        updated_at,
+        status,
+        moderation_state,
+        error_info,
+        deleted,
+        published,
+        moderated,
+        beta,
+        maintenance,
+        restricted,
+        use_high_report_threshold,
+        marketplace,
+        review_revision,
+        author_price_json,
+        required_dlc_json,
+        required_mods_json,
+        achievement_friendly,
+        default_locale,
+        supported_locales_json,
+        release_notes_json,
+        stats_json,
+        custom_data_json,
+        catalog_info_json,
+        prices_json,
+        categories_json,
+        platforms_json,
+        preview_image_url,
+        cover_image_url,
+        preview_image_json,
+        cover_image_json,
+        screenshot_images_json,
+        videos_json,
+        details_url,
+        first_seen_at,
+        last_seen_at,
+        last_seen_ptime,
+        last_known_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(mod_id) DO UPDATE SET
+        product = excluded.product,
+        product_title = excluded.product_title,
+        title = excluded.title,
+        overview = excluded.overview,
+        description = excluded.description,
+        content_type = excluded.content_type,
+        author_displayname = excluded.author_displayname,
+        author_buid = excluded.author_buid,
+        author_verified = excluded.author_verified,
+        author_official = excluded.author_official,
+        published_buid = excluded.published_buid,
+        updated_buid = excluded.updated_buid,
+        created_at = excluded.created_at,
+        published_at = excluded.published_at,
+        first_published_at = excluded.first_published_at,
+        updated_at = excluded.updated_at,
+        status = excluded.status,
+        moderation_state = excluded.moderation_state,
+        error_info = excluded.error_info,
+        deleted = excluded.deleted,
+        published = excluded.published,
+        moderated = excluded.moderated,
+        beta = excluded.beta,
+        maintenance = excluded.maintenance,
+        restricted = excluded.restricted,
+        use_high_report_threshold = excluded.use_high_report_threshold,
+        marketplace = excluded.marketplace,
+        review_revision = excluded.review_revision,
+        author_price_json = excluded.author_price_json,
+        required_dlc_json = excluded.required_dlc_json,
+        required_mods_json = excluded.required_mods_json,
+        achievement_friendly = excluded.achievement_friendly,
+        default_locale = excluded.default_locale,
+        supported_locales_json = excluded.supported_locales_json,
+        release_notes_json = excluded.release_notes_json,
+        stats_json = excluded.stats_json,
+        custom_data_json = excluded.custom_data_json,
+        catalog_info_json = excluded.catalog_info_json,
+        prices_json = excluded.prices_json,
+        categories_json = excluded.categories_json,
+        platforms_json = excluded.platforms_json,
+        preview_image_url = excluded.preview_image_url,
+        cover_image_url = excluded.cover_image_url,
+        preview_image_json = excluded.preview_image_json,
+        cover_image_json = excluded.cover_image_json,
+        screenshot_images_json = excluded.screenshot_images_json,
+        videos_json = excluded.videos_json,
+        details_url = excluded.details_url,
+        last_seen_at = excluded.last_seen_at,
+        last_seen_ptime = excluded.last_seen_ptime,
+        last_known_hash = excluded.last_known_hash,
+        first_seen_at = COALESCE(mods.first_seen_at, excluded.first_seen_at)
+"""
+
+
+def _mod_params(mod: Mod, last_seen_at: str, mod_hash: str) -> Tuple[Any, ...]:
+    categories_json = _json_text(mod.categories)
+    platforms_json = _json_text(mod.hardware_platforms)
+    author_price_json = _json_text(mod.author_price)
+    required_dlc_json = _json_text(mod.required_dlc)
+    required_mods_json = _json_text(mod.required_mods)
+    supported_locales_json = _json_text(mod.supported_locales)
+    release_notes_json = _json_text(mod.release_notes)
+    stats_json = _json_text(mod.stats)
+    custom_data_json = _json_text(mod.custom_data)
+    catalog_info_json = _json_text(mod.catalog_info)
+    prices_json = _json_text(mod.prices)
+    preview_image_json = _json_text(mod.preview_image)
+    cover_image_json = _json_text(mod.cover_image)
+    screenshot_images_json = _json_text(mod.screenshot_images)
+    videos_json = _json_text(mod.videos)
+    return (
+        mod.mod_id,
+        mod.product,
+        mod.product_title,
+        mod.title,
+        mod.overview,
+        mod.description,
+        mod.content_type,
+        mod.author_displayname,
+        mod.author_buid,
+        int(mod.author_verified),
+        int(mod.author_official),
+        mod.published_buid,
+        mod.updated_buid,
+        mod.created_at,
+        mod.published_at,
+        mod.first_published_at,
+        mod.updated_at,
+        mod.status,
+        mod.moderation_state,
+        mod.error_info,
+        int(mod.deleted),
+        int(mod.published),
+        int(mod.moderated),
+        int(mod.beta),
+        int(mod.maintenance),
+        int(mod.restricted),
+        int(mod.use_high_report_threshold),
+        int(mod.marketplace),
+        int(mod.review_revision),
+        author_price_json,
+        required_dlc_json,
+        required_mods_json,
+        int(mod.achievement_friendly),
+        mod.default_locale,
+        supported_locales_json,
+        release_notes_json,
+        stats_json,
+        custom_data_json,
+        catalog_info_json,
+        prices_json,
+        categories_json,
+        platforms_json,
+        mod.preview_image_url,
+        mod.cover_image_url,
+        preview_image_json,
+        cover_image_json,
+        screenshot_images_json,
+        videos_json,
+        mod.details_url,
+        last_seen_at,
+        last_seen_at,
+        mod.published_at,
+        mod_hash,
+    )
+
+
+_shared_stores: Dict[Path, SQLiteStore] = {}
+
+
+def get_shared_store(path: Path) -> SQLiteStore:
+    """Return a process-wide store for ``path``, opened once and closed at exit.
+
+    Callers must not ``close()`` the returned store. Like any ``SQLiteStore`` it
+    is bound to the thread that first opened it.
+    """
+    key = Path(path).resolve()
+    store = _shared_stores.get(key)
+    if store is None:
+        store = SQLiteStore(Path(path))
+        _shared_stores[key] = store
+    return store
+
+
+def _close_shared_stores() -> None:
+    while _shared_stores:
+        _, store = _shared_stores.popitem()
+        store.close()
+
+
+atexit.register(_close_shared_stores)
 
 
 class NullStore:
-    def __init__(self) -> None:
-        pass
+    __slots__ = ()
 
     def close(self) -> None:
         return None
@@ -558,6 +632,12 @@ class NullStore:
     def set_meta(self, key: str, value: str) -> None:
         return None
 
+    def set_meta_many(self, pairs: Dict[str, str]) -> None:
+        return None
+
+    def iter_export_rows(self, table: str) -> Iterator[Dict[str, Any]]:
+        return iter(())
+
     def export_json(self) -> Dict[str, Any]:
         return {"mods": [], "posts": [], "meta": []}
 
@@ -567,6 +647,9 @@ class NullStore:
     def upsert_mod(self, mod: Mod, last_seen_at: str, mod_hash: str) -> None:
         return None
 
+    def upsert_mods(self, rows: Iterable[Tuple[Mod, str, str]]) -> None:
+        return None
+
     def mark_posted(
         self,
         mod_id: str,
@@ -581,6 +664,13 @@ class NullStore:
     ) -> None:
         return None
 
+    def mark_posted_bulk(self, rows: Iterable[PostRow]) -> None:
+        return None
+
+
+def _json_text(value: Any) -> str:
+    return json_dumps(value).decode("utf-8")
+
 
 def _json_load(value: Optional[str], default: Any) -> Any:
     if value is None:
@@ -588,6 +678,6 @@ def _json_load(value: Optional[str], default: Any) -> Any:
     if isinstance(value, (dict, list)):
         return value
     try:
-        return json.loads(value)
+        return json_loads(value)
     except (TypeError, ValueError):
         return default
@@ -1,4 +1,7 @@
-import requests
+from .http_session import get_session
+from .utils import json_dumps
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class DiscordClient:
@@ -6,7 +9,14 @@ class DiscordClient:
         if not webhook_url:
             raise ValueError("Missing DISCORD_WEBHOOK_URL")
         self.webhook_url = webhook_url
+        self.session = get_session()
 
     def send_message(self, content: str) -> None:
-        response = requests.post(self.webhook_url, json={"content": content}, timeout=30)
+        # (connect, read): a stalled handshake fails fast instead of eating the full 30s.
+        response = self.session.post(
+            self.webhook_url,
+            data=json_dumps({"content": content}),
+            headers=_JSON_HEADERS,
+            timeout=(5, 30),
+        )
         response.raise_for_status()
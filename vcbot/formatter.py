@@ -1,11 +1,12 @@
 import logging
 import traceback
-from dataclasses import dataclass, asdict
-import html
+from dataclasses import fields
+import functools
 import os
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Tuple, Optional
+import string
+from typing import Any, Dict, List, Optional, Tuple
 
 from .bethesda import Mod
 from .utils import bethesda_image_url
@@ -94,12 +95,8 @@ def _summary_text(mod: Mod) -> str:
 
 
 def _platform_emojis(platforms: List[str]) -> str:
-    tokens = []
-    for platform in platforms:
-        emoji = PLATFORM_EMOJI.get(platform)
-        if emoji and emoji not in tokens:
-            tokens.append(emoji)
-    return " ".join(tokens[:MAX_TITLE_FLAIRS]) if tokens else ""
+    emojis = dict.fromkeys(PLATFORM_EMOJI[p] for p in platforms if p in PLATFORM_EMOJI)
+    return " ".join(list(emojis)[:MAX_TITLE_FLAIRS])
 
 
 def _platform_full_names(platforms: List[str]) -> str:
@@ -111,12 +108,17 @@ def _platform_full_names(platforms: List[str]) -> str:
 def _platform_wiki_labels(platforms: List[str]) -> str:
     if not platforms:
         return "N/A"
-    labels = []
-    for platform in platforms:
-        label = PLATFORM_WIKI_LABEL.get(platform, platform)
-        if label not in labels:
-            labels.append(label)
-    return ", ".join(labels)
+    return ", ".join(dict.fromkeys(PLATFORM_WIKI_LABEL.get(p, p) for p in platforms))
+
+
+@functools.lru_cache(maxsize=64)
+def _platform_bundle(platforms: Tuple[str, ...]) -> Tuple[str, str, str]:
+    """``(emojis, full_names, wiki_labels)`` for a platform list; mods share a few combos."""
+    return (
+        _platform_emojis(platforms),
+        _platform_full_names(platforms),
+        _platform_wiki_labels(platforms),
+    )
 
 
 def _format_value(value: Any) -> str:
@@ -148,19 +150,36 @@ def _release_notes_text(mod: Mod) -> str:
     return "\n".join(parts) if parts else "N/A"
 
 
+_FENCED_CODE = re.compile(r"```.*?```", re.DOTALL)
+_INLINE_CODE = re.compile(r"`([^`]*)`")
+_MARKDOWN_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]+\)")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_MARKDOWN_ESCAPES = str.maketrans({char: "\\" + char for char in "\\`*_{}[]()#+-.!|>"})
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_newlines(text: str) -> str:
+    """Unix newlines, surrounding whitespace stripped (shared by every description view)."""
+    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
 def _strip_markdown(text: str) -> str:
-    cleaned = text.replace("\r\n", "\n").replace("\r", "\n").strip()
-    cleaned = re.sub(r"```.*?```", "", cleaned, flags=re.DOTALL)
-    cleaned = re.sub(r"`([^`]*)`", r"\1", cleaned)
-    cleaned = re.sub(r"!\[([^\]]*)\]\([^)]+\)", r"\1", cleaned)
-    cleaned = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", cleaned)
+    cleaned = _normalize_newlines(text)
+    # Every pattern below needs a backtick or "[", so plain prose skips all four passes.
+    if "`" not in cleaned and "[" not in cleaned:
+        return cleaned
+    cleaned = _FENCED_CODE.sub("", cleaned)
+    cleaned = _INLINE_CODE.sub(r"\1", cleaned)
+    cleaned = _MARKDOWN_IMAGE.sub(r"\1", cleaned)
+    cleaned = _MARKDOWN_LINK.sub(r"\1", cleaned)
     return cleaned
 
 
 def _escape_markdown(text: str) -> str:
-    return re.sub(r"([\\`*_{}\[\]()#+\-.!|>])", r"\\\1", text)
+    return text.translate(_MARKDOWN_ESCAPES)
 
 
+@functools.lru_cache(maxsize=256)
 def _clean_description(text: Optional[str]) -> str:
     if not text:
         return "N/A"
@@ -170,17 +189,54 @@ def _clean_description(text: Optional[str]) -> str:
     return _escape_markdown(cleaned)
 
 
+@functools.lru_cache(maxsize=256)
 def _markdown_description(text: Optional[str]) -> str:
     if not text:
         return "N/A"
-    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+    return _normalize_newlines(text)
+
+
+def _wiki_heading(match: "re.Match[str]") -> str:
+    marks = "=" * len(match.group(1))
+    return f"{marks} {match.group(2)} {marks}"
+
+
+# Markdown -> MediaWiki rewrites for _wiki_description, applied in order.
+_WIKI_RULES = (
+    # Convert headers: ### Header -> === Header ===
+    (re.compile(r"^(#{1,6})\s*(.+)$", re.MULTILINE), _wiki_heading),
+    # - item or * item -> * item
+    (re.compile(r"^[\-\*]\s+", re.MULTILINE), r"* "),
+    # Convert bold: **text** or __text__ -> '''text'''
+    (re.compile(r"\*\*(.+?)\*\*"), r"'''\1'''"),
+    (re.compile(r"__(.+?)__"), r"'''\1'''"),
+    # Convert italic: *text* or _text_ -> ''text''
+    (re.compile(r"(?<!['\w])\*([^*\n]+)\*(?!['\w])"), r"''\1''"),
+    (re.compile(r"(?<!['\w])_([^_\n]+)_(?!['\w])"), r"''\1''"),
+    # Convert links: [text](url) -> [url text]
+    (re.compile(r"\[([^\]]+)\]\(([^)]+)\)"), r"[\2 \1]"),
+    # Convert images: ![alt](url) -> [[File:url|alt]]
+    (re.compile(r"!\[([^\]]*)\]\(([^)]+)\)"), r"[[File:\2|\1]]"),
+    # Convert inline code: `code` -> <code>code</code>
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    # Convert code blocks: ```code``` -> <pre>code</pre>
+    (re.compile(r"```\w*\n?(.*?)```", re.DOTALL), r"<pre>\1</pre>"),
+    # Convert ordered lists: 1. item -> # item
+    (re.compile(r"^\d+\.\s+", re.MULTILINE), r"# "),
+    # Convert horizontal rules: --- or *** -> ----
+    (re.compile(r"^[\-\*]{3,}\s*$", re.MULTILINE), r"----"),
+)
+
+# Text without any of these cannot match a _WIKI_RULES pattern (prose skips the passes).
+_WIKI_MARKUP_HINT = re.compile(r"[#*\-_\[`]|\d\.")
 
 
+@functools.lru_cache(maxsize=256)
 def _wiki_description(text: Optional[str]) -> str:
     """Convert markdown text to MediaWiki wikitext format."""
     if not text:
         return "N/A"
-    result = text.replace("\r\n", "\n").replace("\r", "\n").strip()
+    result = _normalize_newlines(text)
     
     # Use pypandoc if available and enabled via USE_PYPANDOC env var
     _init_pypandoc()
@@ -189,43 +245,10 @@ def _wiki_description(text: Optional[str]) -> str:
         return _pypandoc.convert_text(result, 'mediawiki', format='markdown')
     
     # Fallback to regex-based conversion
-    # Convert headers: ### Header -> === Header ===
-    result = re.sub(r"^######\s*(.+)$", r"====== \1 ======", result, flags=re.MULTILINE)
-    result = re.sub(r"^#####\s*(.+)$", r"===== \1 =====", result, flags=re.MULTILINE)
-    result = re.sub(r"^####\s*(.+)$", r"==== \1 ====", result, flags=re.MULTILINE)
-    result = re.sub(r"^###\s*(.+)$", r"=== \1 ===", result, flags=re.MULTILINE)
-    result = re.sub(r"^##\s*(.+)$", r"== \1 ==", result, flags=re.MULTILINE)
-    result = re.sub(r"^#\s*(.+)$", r"= \1 =", result, flags=re.MULTILINE)
-    
-    # - item or * item -> * item
-    result = re.sub(r"^[\-\*]\s+", r"* ", result, flags=re.MULTILINE)
-    
-    # Convert bold: **text** or __text__ -> '''text'''
-    result = re.sub(r"\*\*(.+?)\*\*", r"'''\1'''", result)
-    result = re.sub(r"__(.+?)__", r"'''\1'''", result)
-    
-    # Convert italic: *text* or _text_ -> ''text''
-    result = re.sub(r"(?<!['\w])\*([^*\n]+)\*(?!['\w])", r"''\1''", result)
-    result = re.sub(r"(?<!['\w])_([^_\n]+)_(?!['\w])", r"''\1''", result)
-    
-    # Convert links: [text](url) -> [url text]
-    result = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\2 \1]", result)
-    
-    # Convert images: ![alt](url) -> [[File:url|alt]]
-    result = re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", r"[[File:\2|\1]]", result)
-    
-    # Convert inline code: `code` -> <code>code</code>
-    result = re.sub(r"`([^`]+)`", r"<code>\1</code>", result)
-    
-    # Convert code blocks: ```code``` -> <pre>code</pre>
-    result = re.sub(r"```\w*\n?(.*?)```", r"<pre>\1</pre>", result, flags=re.DOTALL)
-    
-    # Convert ordered lists: 1. item -> # item
-    result = re.sub(r"^\d+\.\s+", r"# ", result, flags=re.MULTILINE)
-    
-    # Convert horizontal rules: --- or *** -> ----
-    result = re.sub(r"^[\-\*]{3,}\s*$", r"----", result, flags=re.MULTILINE)
-    
+    if not _WIKI_MARKUP_HINT.search(result):
+        return result
+    for pattern, replacement in _WIKI_RULES:
+        result = pattern.sub(replacement, result)
     return result
 
 
@@ -234,43 +257,13 @@ def _totals(mod: Mod) -> Dict[str, Any]:
     return totals if isinstance(totals, dict) else {}
 
 
-def _price_text(mod: Mod) -> str:
-    if not mod.prices:
-        return "N/A"
-    parts = []
-    for price in mod.prices:
+def _price_strings(mod: Mod) -> Tuple[str, str, str]:
+    """``(prices, price_credits, prices_plain)`` from the first price with an amount."""
+    for price in mod.prices or ():
         amount = price.get("amount")
-        if amount is None:
-            continue
-        parts.append(f"{PRICE_EMOJI} {amount}")
-    if not parts:
-        return "N/A"
-    return parts[0]
-
-
-def _price_credits(mod: Mod) -> str:
-    if not mod.prices:
-        return "N/A"
-    for price in mod.prices:
-        amount = price.get("amount")
-        if amount is None:
-            continue
-        return f"{{{{credits|{amount}}}}}"
-    return "N/A"
-
-
-def _price_text_plain(mod: Mod) -> str:
-    if not mod.prices:
-        return "N/A"
-    parts = []
-    for price in mod.prices:
-        amount = price.get("amount")
-        if amount is None:
-            continue
-        parts.append(f"{amount} Credits")
-    if not parts:
-        return "N/A"
-    return parts[0]
+        if amount is not None:
+            return f"{PRICE_EMOJI} {amount}", f"{{{{credits|{amount}}}}}", f"{amount} Credits"
+    return "N/A", "N/A", "N/A"
 
 
 def _cover_filename(mod: Mod) -> str:
@@ -287,40 +280,39 @@ def _release_date(mod: Mod) -> str:
 
 
 def _latest_version(mod: Mod) -> str:
-    latest: Optional[Dict[str, Any]] = None
-    for entry in mod.release_notes:
-        notes = entry.get("release_notes") if isinstance(entry, dict) else None
-        if not isinstance(notes, list):
-            continue
-        for note in notes:
-            if not isinstance(note, dict):
-                continue
-            if not note.get("published", True):
-                continue
-            if latest is None or (note.get("utime") or 0) > (latest.get("utime") or 0):
-                latest = note
+    published = (
+        note
+        for entry in mod.release_notes
+        if isinstance(entry, dict) and isinstance(entry.get("release_notes"), list)
+        for note in entry["release_notes"]
+        if isinstance(note, dict) and note.get("published", True)
+    )
+    # max() keeps the first note on a utime tie, like the strict ">" it replaces.
+    latest = max(published, key=lambda note: note.get("utime") or 0, default=None)
     if latest and latest.get("version_name"):
         return str(latest.get("version_name"))
     return "N/A"
 
 
+def _screenshot_url(image: Dict[str, Any]) -> Optional[str]:
+    url = image.get("url") or image.get("uri") or image.get("path") or image.get("link")
+    if not url:
+        s3bucket = image.get("s3bucket")
+        s3key = image.get("s3key")
+        if s3bucket and s3key:
+            url = bethesda_image_url(s3bucket, s3key)
+    return url
+
+
 def _image_urls(mod: Mod, raw: bool = False) -> List[str]:
-    urls: List[str] = []
-    cover_url = _non_banner_cover_url(mod)
-    if cover_url and cover_url not in urls:
-        urls.append(cover_url)
-    for image in mod.screenshot_images:
-        if _is_banner_image(image):
-            continue
-        url = image.get("url") or image.get("uri") or image.get("path") or image.get("link")
-        if not url:
-            s3bucket = image.get("s3bucket")
-            s3key = image.get("s3key")
-            if s3bucket and s3key:
-                url = bethesda_image_url(s3bucket, s3key)
-        if url and url not in urls:
-            urls.append(url)
-    return urls
+    candidates = [_non_banner_cover_url(mod)]
+    candidates.extend(
+        _screenshot_url(image)
+        for image in mod.screenshot_images
+        if not _is_banner_image(image)
+    )
+    # dict.fromkeys drops repeats while keeping first-seen order.
+    return list(dict.fromkeys(url for url in candidates if url))
 
 
 def _image_urls_text(mod: Mod) -> str:
@@ -331,10 +323,15 @@ def _image_urls_text(mod: Mod) -> str:
 def _is_banner_image(image: Dict[str, Any]) -> bool:
     if not image:
         return False
-    classification = str(image.get("classification") or "").lower()
-    filename = str(image.get("filename") or "").lower()
-    s3key = str(image.get("s3key") or "").lower()
-    return "banner" in classification or "banner" in filename or "/banner" in s3key
+    # Checked lazily: most images are decided by the first non-empty field.
+    classification = image.get("classification")
+    if classification and "banner" in str(classification).lower():
+        return True
+    filename = image.get("filename")
+    if filename and "banner" in str(filename).lower():
+        return True
+    s3key = image.get("s3key")
+    return bool(s3key) and "/banner" in str(s3key).lower()
 
 
 def _banner_url(mod: Mod) -> str:
@@ -357,13 +354,62 @@ def build_post_title(mod: Mod, post_type: str, include_emojis: bool = True) -> s
         date_hint = mod.updated_at[:10] if mod.updated_at else "Update"
         return f"[{_product_label(mod)}] Update: {mod.title} ({date_hint})"
     creator = mod.author_displayname or "Unknown Creator"
-    emojis = _platform_emojis(mod.hardware_platforms) if include_emojis else ""
+    emojis = _platform_bundle(tuple(mod.hardware_platforms))[0] if include_emojis else ""
     suffix = f" {emojis}" if emojis else ""
     return f"{creator} presents: {mod.title}{suffix}"
 
 
+@functools.lru_cache(maxsize=16)
+def _read_template(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _load_template(template_path: Path) -> str:
+    """Template text, re-read only when the file changes on disk (the UI stays open)."""
+    return _read_template(str(template_path), template_path.stat().st_mtime_ns)
+
+
+_FORMATTER = string.Formatter()
+_MOD_FIELDS = tuple(field.name for field in fields(Mod))
+_CompiledTemplate = Optional[Tuple[Tuple[str, Optional[str], str, Optional[str]], ...]]
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_template(template: str) -> _CompiledTemplate:
+    """Pre-parse ``template`` into ``(literal, field, spec, conversion)`` chunks.
+
+    Returns ``None`` when a placeholder uses attribute/index access or a nested
+    format spec; those templates keep going through ``str.format_map``.
+    """
+    chunks = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        if field is not None and (not field.isidentifier() or "{" in (spec or "")):
+            return None
+        chunks.append((literal, field, spec or "", conversion))
+    return tuple(chunks)
+
+
+def _apply_template(template: str, data: Dict[str, Any]) -> str:
+    chunks = _compile_template(template)
+    if chunks is None:
+        return template.format_map(_SafeDict(data))
+    parts: List[str] = []
+    for literal, field, spec, conversion in chunks:
+        parts.append(literal)
+        if field is not None:
+            value = data.get(field, "N/A")
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, spec))
+    return "".join(parts)
+
+
 def render_post_body(mod: Mod, post_type: str, template_path: Path) -> str:
-    template = template_path.read_text(encoding="utf-8")
+    return render_post_template(mod, post_type, _load_template(template_path))
+
+
+def render_post_template(mod: Mod, post_type: str, template: str) -> str:
+    """Render already-loaded template text for ``mod``."""
     author = mod.author_displayname or "Unknown"
     author_url = (
         f"https://creations.bethesda.net/en/{mod.product.lower()}/all"
@@ -372,8 +418,13 @@ def render_post_body(mod: Mod, post_type: str, template_path: Path) -> str:
         else "N/A"
     )
 
-    # Start with all base Mod fields
-    data: Dict[str, Any] = asdict(mod)
+    platform_emojis, platform_full_names, platform_wiki = _platform_bundle(
+        tuple(mod.hardware_platforms)
+    )
+    prices, price_credits, prices_plain = _price_strings(mod)
+
+    # Start with all base Mod fields (shallow: templates only stringify them)
+    data: Dict[str, Any] = {name: getattr(mod, name) for name in _MOD_FIELDS}
 
     # Add/Override with computed or human-friendly fields
     data.update({
@@ -389,13 +440,13 @@ def render_post_body(mod: Mod, post_type: str, template_path: Path) -> str:
         "product_wiki": PRODUCT_WIKI_NAME.get(mod.product, mod.product_title or mod.product),
         "product_wiki_footer": PRODUCT_WIKI_FOOTER.get(mod.product, mod.product_title or mod.product),
         "platforms": _join_list(mod.hardware_platforms),
-        "platform_full_names": _platform_full_names(mod.hardware_platforms),
-        "platform_wiki": _platform_wiki_labels(mod.hardware_platforms),
-        "platform_emojis": _platform_emojis(mod.hardware_platforms),
+        "platform_full_names": platform_full_names,
+        "platform_wiki": platform_wiki,
+        "platform_emojis": platform_emojis,
         "categories": _join_list(mod.categories),
-        "prices": _price_text(mod),
-        "prices_plain": _price_text_plain(mod),
-        "price_credits": _price_credits(mod),
+        "prices": prices,
+        "prices_plain": prices_plain,
+        "price_credits": price_credits,
         "release_date": _release_date(mod),
         "size": "N/A",
         "version": _latest_version(mod),
@@ -415,7 +466,7 @@ def render_post_body(mod: Mod, post_type: str, template_path: Path) -> str:
         if value is None:
             data[key] = "N/A"
 
-    return template.format_map(_SafeDict(data))
+    return _apply_template(template, data)
 
 
 class _SafeDict(dict):
@@ -0,0 +1,31 @@
+import threading
+from typing import Any
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> Any:
+    """Return the process-wide pooled ``requests.Session`` (created on first use).
+
+    Requests without per-session state (Bethesda API, image CDN, OAuth token
+    exchange) share it so repeated calls to the same host reuse keep-alive
+    connections instead of paying a new TCP/TLS handshake each time.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
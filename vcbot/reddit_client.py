@@ -1,14 +1,59 @@
+import concurrent.futures
+import functools
+import tempfile
 import time
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Any, Callable, Optional, Tuple, List, TypeVar, Union
 import logging
 import requests
 import json
 from pathlib import Path
 import praw
-from .utils import download_image
+
+from .http_session import get_session
+from .utils import json_dumps
 
 logger = logging.getLogger("vcbot.reddit")
 
+T = TypeVar("T")
+
+_GRAPHQL_URL = "https://www.reddit.com/svc/shreddit/graphql"
+_MAX_UPLOAD_WORKERS = 4
+_MAX_RETRIES = 3
+_RETRY_DELAY = 2  # seconds, multiplied by the attempt number
+
+
+class _TransientGraphQLError(Exception):
+    """GraphQL "Upstream Service error" responses, which usually succeed on retry."""
+
+
+def _graphql_error(prefix: str, errors: List[dict]) -> Exception:
+    error_msg = json.dumps(errors)
+    if any("Upstream Service error" in err.get("message", "") for err in errors):
+        return _TransientGraphQLError(f"{prefix}: {error_msg}")
+    return Exception(f"{prefix}: {error_msg}")
+
+
+def _is_retryable(error: Exception) -> bool:
+    # A 4xx (stale CSRF token or cookies, bad input) fails the same way every time,
+    # so don't burn the backoff on it; 429 is the exception.
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    return status is None or status >= 500 or status == 429
+
+
+def _with_retries(label: str, func: Callable[..., T], *args: Any) -> T:
+    """Call ``func``, retrying network failures and transient GraphQL errors with backoff."""
+    for attempt in range(1, _MAX_RETRIES):
+        try:
+            return func(*args)
+        except (requests.exceptions.RequestException, _TransientGraphQLError) as e:
+            if not _is_retryable(e):
+                raise
+            logger.warning(f"{label} failed (attempt {attempt}/{_MAX_RETRIES}): {e}. Retrying...")
+            time.sleep(_RETRY_DELAY * attempt)
+    return func(*args)
+
+
 class RedditClient:
     def __init__(
         self,
@@ -67,9 +112,26 @@ class RedditClient:
         else:
             raise ValueError("Missing Reddit configuration (official credentials or session cookies)")
 
-    def submit_post(self, title: str, body: str, flair_id: Optional[str] = None, image_paths: Optional[List[Path]] = None) -> Tuple[str, str]:
+    def submit_post(
+        self,
+        title: str,
+        body: str,
+        flair_id: Optional[str] = None,
+        image_paths: Optional[List[Path]] = None,
+        image_blobs: Optional[List[Tuple[str, bytes]]] = None,
+    ) -> Tuple[str, str]:
+        """Submit a post with images from files and/or in-memory (name, bytes) blobs."""
         flair_id = flair_id or self.flair_id
         if self.reddit:
+            if image_blobs:
+                # PRAW only uploads from files, so spool in-memory images to a scratch dir.
+                with tempfile.TemporaryDirectory() as scratch:
+                    spooled = list(image_paths or [])
+                    for name, data in image_blobs:
+                        path = Path(scratch) / name
+                        path.write_bytes(data)
+                        spooled.append(path)
+                    return self.submit_post(title, body, flair_id=flair_id, image_paths=spooled)
             if image_paths:
                 # PRAW gallery upload
                 images = [{"image_path": str(p)} for p in image_paths]
@@ -89,14 +151,14 @@ class RedditClient:
                 )
             return submission.id, submission.url
         else:
-            return self._submit_post_web(title, body, flair_id=flair_id, image_paths=image_paths)
+            return self._submit_post_web(
+                title, body, flair_id=flair_id, image_paths=image_paths, image_blobs=image_blobs
+            )
 
-    def _upload_image_web(self, image_path: Path) -> str:
-        # 1. Create Media Upload Lease
-        url = "https://www.reddit.com/svc/shreddit/graphql"
-        mimetype = "image/jpeg" # We convert all to jpg in utils.py
-        
-        payload = {
+    @functools.cached_property
+    def _lease_payload(self) -> bytes:
+        # Identical for every image of every post, so serialize it once per client.
+        return json_dumps({
             "operation": "CreateMediaUploadLease",
             "variables": {
                 "input": {
@@ -104,14 +166,18 @@ class RedditClient:
                 }
             },
             "csrf_token": self.csrf_token
-        }
-        
-        response = self.session.post(url, json=payload)
+        })
+
+    def _upload_image_web(self, name: str, source: Union[Path, bytes]) -> str:
+        # 1. Create Media Upload Lease
+        mimetype = "image/jpeg" # We convert all to jpg in utils.py
+
+        response = self.session.post(_GRAPHQL_URL, data=self._lease_payload)
         response.raise_for_status()
         data = response.json()
         
         if data.get("errors"):
-             raise Exception(f"Failed to create media upload lease: {json.dumps(data['errors'])}")
+            raise _graphql_error("Failed to create media upload lease", data["errors"])
 
         lease_data = data.get("data", {}).get("createMediaUploadLease", {})
         if not lease_data or not lease_data.get("ok"):
@@ -122,28 +188,60 @@ class RedditClient:
         headers = {h["header"]: h["value"] for h in lease_data["uploadLease"]["uploadLeaseHeaders"]}
         
         # 2. Upload to S3
-        with open(image_path, "rb") as f:
-            files = {"file": (image_path.name, f, mimetype)}
-            # S3 POST expects headers as form data fields
-            upload_response = requests.post(upload_url, data=headers, files=files)
-            upload_response.raise_for_status()
-            
+        # S3 POST expects headers as form data fields. The pooled session (not
+        # self.session, which carries Reddit cookies) keeps the bucket connection warm.
+        s3 = get_session()
+        if isinstance(source, Path):
+            with open(source, "rb") as f:
+                upload_response = s3.post(
+                    upload_url, data=headers, files={"file": (name, f, mimetype)}
+                )
+        else:
+            upload_response = s3.post(
+                upload_url, data=headers, files={"file": (name, source, mimetype)}
+            )
+        upload_response.raise_for_status()
+
         return media_id
 
-    def _submit_post_web(self, title: str, body: str, flair_id: Optional[str] = None, image_paths: Optional[List[Path]] = None) -> Tuple[str, str]:
+    def _submit_post_web(
+        self,
+        title: str,
+        body: str,
+        flair_id: Optional[str] = None,
+        image_paths: Optional[List[Path]] = None,
+        image_blobs: Optional[List[Tuple[str, bytes]]] = None,
+    ) -> Tuple[str, str]:
         # Implementation of post submission via GraphQL (Web/Shreddit API)
-        url = "https://www.reddit.com/svc/shreddit/graphql"
         
         media_ids = []
-        if image_paths:
-            logger.info("Uploading %d images for Reddit post", len(image_paths))
-            for path in image_paths:
-                try:
-                    media_id = self._upload_image_web(path)
-                    media_ids.append(media_id)
-                    logger.debug("Uploaded image %s -> mediaId: %s", path, media_id)
-                except Exception as e:
-                    logger.error(f"Failed to upload image {path}: {e}")
+        uploads: List[Tuple[str, Union[Path, bytes]]] = [
+            (path.name, path) for path in image_paths or []
+        ]
+        uploads.extend(image_blobs or [])
+        if uploads:
+            logger.info("Uploading %d images for Reddit post", len(uploads))
+            # Each upload is a lease call plus an S3 POST; overlap them, but keep the
+            # worker count small so a big gallery doesn't trip Reddit's rate limits.
+            workers = min(_MAX_UPLOAD_WORKERS, len(uploads))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _with_retries, f"Image upload {name}", self._upload_image_web, name, source
+                    )
+                    for name, source in uploads
+                ]
+                # Collect in submission order so the gallery keeps the image order.
+                for (name, _), future in zip(uploads, futures):
+                    try:
+                        media_id = future.result()
+                        media_ids.append(media_id)
+                        logger.debug("Uploaded image %s -> mediaId: %s", name, media_id)
+                    except Exception as e:
+                        logger.error(f"Failed to upload image {name}: {e}")
+            if not media_ids:
+                # No gallery key is sent below, so this becomes a plain text post.
+                logger.error("All %d image uploads failed; submitting without a gallery", len(uploads))
 
         variables = {
             "input": {
@@ -157,7 +255,7 @@ class RedditClient:
             }
         }
         
-        if image_paths and media_ids:
+        if media_ids:
             # HAR uses 'postType' in ValidateCreatePostInput but in CreatePost it might not be there
             # Actually, looking at CreatePost in HAR again:
             # {
@@ -195,36 +293,17 @@ class RedditClient:
             "csrf_token": self.csrf_token
         }
         
-        # Implement retry for transient GraphQL errors
-        max_retries = 3
-        retry_delay = 2 # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                response = self.session.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("errors"):
-                    error_msg = json.dumps(data["errors"])
-                    # Check if it's an "Upstream Service error" which might be transient
-                    is_transient = any("Upstream Service error" in err.get("message", "") for err in data["errors"])
-                    
-                    if is_transient and attempt < max_retries - 1:
-                        logger.warning(f"Reddit GraphQL transient error (attempt {attempt+1}/{max_retries}): {error_msg}. Retrying...")
-                        time.sleep(retry_delay * (attempt + 1))
-                        continue
-                    
-                    raise Exception(f"Reddit GraphQL Error: {error_msg}")
-                
-                break # Success
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Reddit GraphQL request failed (attempt {attempt+1}/{max_retries}): {e}. Retrying...")
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                raise
-            
+        def create_post() -> dict:
+            response = self.session.post(_GRAPHQL_URL, data=json_dumps(payload))
+            response.raise_for_status()
+            data = response.json()
+            if data.get("errors"):
+                raise _graphql_error("Reddit GraphQL Error", data["errors"])
+            return data
+
+        # Uploaded media_ids are kept across attempts; only the CreatePost call is retried.
+        data = _with_retries("Reddit GraphQL request", create_post)
+
         # The mutation name in HAR is CreatePost, but sometimes Shreddit returns it under a different key.
         # Let's check the HAR for the response key.
         # Actually, my previous code used 'createSubredditPost'. 
@@ -1,9 +1,18 @@
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 import base64
+import functools
+import itertools
 import json
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+from .http_session import get_session
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -18,6 +27,8 @@ def iso_from_epoch(value: Optional[int]) -> Optional[str]:
         return None
 
 
+# The same first_ptime/cutoff strings are re-parsed for every mod on every page.
+@functools.lru_cache(maxsize=4096)
 def parse_iso(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
@@ -27,6 +38,23 @@ def parse_iso(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
+def json_dumps(value: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (compact, or 2-space indented), using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(raw: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Covers and screenshots are re-resolved on every render and listing pass.
+@functools.lru_cache(maxsize=4096)
 def bethesda_image_url(s3bucket: Optional[str], s3key: Optional[str]) -> Optional[str]:
     if not s3bucket or not s3key:
         return None
@@ -41,26 +69,89 @@ def bethesda_image_url(s3bucket: Optional[str], s3key: Optional[str]) -> Optiona
     return f"https://ugcmods.bethesda.net/image/{token}"
 
 
-def download_image(url: str, output_path: Path, convert_to_jpg: bool = False) -> bool:
-    import requests
-    import logging
+def _is_uploadable_jpeg(head: bytes) -> bool:
+    """True if ``head`` starts a baseline RGB/grayscale JPEG that can skip re-encoding.
+
+    Decided from the bytes, not Content-Type: a mislabeled WebP or HTML error page
+    must still go through PIL, as must CMYK or progressive JPEGs Reddit rejects.
+    Only the header is parsed; a head too short to reach the frame header is
+    treated as not-uploadable and re-encoded.
+    """
+    if not head.startswith(b"\xff\xd8\xff"):
+        return False
+    from PIL import Image
+    import io
+    try:
+        with Image.open(io.BytesIO(head)) as image:
+            return (
+                image.format == "JPEG"
+                and image.mode in ("RGB", "L")
+                and not image.info.get("progressive")
+            )
+    except Exception:
+        return False
+
+
+def _encode_jpeg(data: bytes) -> bytes:
     from PIL import Image
     import io
+    image = Image.open(io.BytesIO(data))
+    # Convert to RGB if necessary (e.g. RGBA, P or CMYK)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def download_image_bytes(
+    url: str, convert_to_jpg: bool = False, session: Any = None
+) -> Optional[bytes]:
+    """Fetch an image into memory (re-encoded as JPEG if asked); None on failure."""
+    import logging
     logger = logging.getLogger("vcbot.utils")
+    if session is None:
+        session = get_session()
     try:
-        response = requests.get(url, timeout=30)
+        response = session.get(url, timeout=30)
         response.raise_for_status()
-        
-        if convert_to_jpg:
-            image = Image.open(io.BytesIO(response.content))
-            # Convert to RGB if necessary (e.g. RGBA or P)
-            if image.mode in ("RGBA", "P"):
-                image = image.convert("RGB")
-            image.save(output_path, "JPEG", quality=90)
-        else:
+
+        data = response.content
+        if not convert_to_jpg or _is_uploadable_jpeg(data):
+            return data
+        return _encode_jpeg(data)
+    except Exception as e:
+        logger.error("Failed to download or convert image %s: %s", url, e)
+        return None
+
+
+def download_image(
+    url: str, output_path: Path, convert_to_jpg: bool = False, session: Any = None
+) -> bool:
+    """Stream an image to disk; only images that need re-encoding are buffered."""
+    import logging
+    logger = logging.getLogger("vcbot.utils")
+    if session is None:
+        session = get_session()
+    opened = False
+    try:
+        with session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=64 * 1024)
+            if convert_to_jpg:
+                head = next(chunks, b"")
+                if _is_uploadable_jpeg(head):
+                    chunks = itertools.chain([head], chunks)
+                else:
+                    chunks = [_encode_jpeg(head + b"".join(chunks))]
             with open(output_path, "wb") as f:
-                f.write(response.content)
+                opened = True
+                for chunk in chunks:
+                    f.write(chunk)
         return True
     except Exception as e:
-        logger.error("Failed to download or convert image %s to %s: %s", url, output_path, e)
+        logger.error("Failed to download image %s to %s: %s", url, output_path, e)
+        if opened:
+            # Don't leave a truncated file behind for the next run to pick up.
+            Path(output_path).unlink(missing_ok=True)
         return False